@@ -1,7 +1,15 @@
 import os
+import asyncio
 import logging
-import json
+from collections import OrderedDict
 from pathlib import Path
+
+try:
+    # orjson parses small JSON payloads several times faster than stdlib json
+    # and accepts bytes directly without an intermediate decode
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 from dotenv import load_dotenv
 from livekit.agents import JobContext, WorkerOptions, cli
 from livekit.agents.llm import ChatChunk
@@ -12,23 +20,63 @@ from mcp_client import (
     create_mcp_server,
     MCPServerWrapper,
     ProgressManager,
-    generate_tool_announcement,
-    generate_query_intent_announcement
+    generate_tool_announcement_stream,
+    generate_query_intent_announcement_stream,
+    generate_combined_announcements
 )
 
 load_dotenv()
 
+# Cap on how many announced phrases are remembered (and fed back into the
+# announcement prompt) to bound memory and auxiliary-LLM prompt size
+_MAX_ANNOUNCED_PHRASES = 16
+
+
+def _user_item_text(item) -> str:
+    """Extract the text content from a single user chat item."""
+    content = getattr(item, 'content', None)
+    if isinstance(content, str):
+        return content
+    if content:
+        first = content[0]
+        if isinstance(first, str):
+            return first
+        return str(getattr(first, 'text', None) or "")
+    return ""
+
+
+def _extract_last_user_text(chat_ctx) -> str:
+    """Extract the text of the last user message from a chat context.
+
+    Uses a single EAFP pass over the items in reverse so the hot LLM path
+    avoids repeated attribute probing and per-item debug formatting.
+    """
+    try:
+        for item in reversed(chat_ctx.items or ()):
+            if getattr(item, 'role', None) != "user":
+                continue
+            text = _user_item_text(item)
+            if text:
+                return text
+    except Exception as e:
+        logging.debug("Error extracting user query: %s", e)
+    return ""
+
 
 class FunctionAgent(Agent):
     """A LiveKit agent that uses MCP tools from one or more MCP servers."""
 
+    # Resolve the default implementation once instead of walking the
+    # Agent.default descriptor chain on every turn
+    _default_llm_node = staticmethod(Agent.default.llm_node)
+
     def __init__(
         self,
         mcp_servers=None,
         enable_tool_announcements=True,
         enable_query_intent_announcement=True,
-        announcement_model="gpt-4o",
-        announcement_temperature=0.9
+        announcement_model="gpt-4o-mini",
+        announcement_temperature=0.4
     ):
         super().__init__(
             instructions="""
@@ -67,207 +115,355 @@ class FunctionAgent(Agent):
         self.enable_query_intent_announcement = enable_query_intent_announcement
         self.announcement_model = announcement_model
         self.announcement_temperature = announcement_temperature
-        self.announced_phrases = set()  # Track phrases to avoid repetition
+        self.announced_phrases: OrderedDict[str, None] = OrderedDict()  # LRU of phrases to avoid repetition
         self.current_user_query = ""  # Track the current user query across tool calls
         self.query_intent_announced = False  # Track if we've announced the query intent
-
-    def llm_node(self, chat_ctx, tools, model_settings):
-        """Override the llm_node to announce tool calls with natural, LLM-generated messages."""
-        async def _llm_node_impl():
-            activity = self._get_activity_or_raise()
-            announced_tools = set()
-
-            # Get the user's last message for context
-            user_query = ""
+        self._pending_announcement_tasks: set[asyncio.Task] = set()  # Keep refs so tasks aren't GC'd
+        self._last_user_item_id: str | None = None  # Cache to avoid rescanning chat history
+        self._last_user_text: str = ""
+        self._fallback_audio: dict[str, list] = {}  # phrase -> synthesized frames
+        self._fallback_audio_pending: set[str] = set()
+        self._announcement_client_warmed = False
+
+        # Pre-warm the announcement LLM connection so the first tool-triggered
+        # announcement doesn't pay the TLS/HTTP handshake at a latency-critical
+        # moment
+        try:
+            asyncio.get_running_loop().create_task(self._warm_announcement_client())
+        except RuntimeError:
+            # No running event loop yet; skip the warmup
+            pass
+
+    async def _warm_announcement_client(self):
+        """Issue a tiny completion to establish the announcement LLM connection.
+
+        Establishes DNS/TLS and the HTTP connection pool ahead of the first
+        real announcement call. One-shot; failures are non-fatal.
+        """
+        if self._announcement_client_warmed:
+            return
+        self._announcement_client_warmed = True
+        try:
+            from mcp_client.announcements import _get_client
+            client = _get_client()
+            await client.chat.completions.create(
+                model=self.announcement_model,
+                messages=[{"role": "user", "content": "ping"}],
+                max_tokens=1
+            )
+        except Exception as e:
+            logging.debug("Announcement client warmup failed: %s", e)
+
+    def _get_last_user_text(self, chat_ctx) -> str:
+        """Resolve the last user message, short-circuiting via a cached item id.
+
+        The newest user message is almost always within the last few chat
+        items (at most behind a trailing assistant/tool-call item), so check
+        the tail first and only fall back to a full scan when necessary. The
+        matched item id is cached so subsequent turns for the same message
+        avoid re-extracting the text.
+        """
+        try:
+            items = chat_ctx.items or ()
+            for item in reversed(items[-4:]):
+                if getattr(item, 'role', None) != "user":
+                    continue
+                item_id = getattr(item, 'id', None)
+                if item_id is not None and item_id == self._last_user_item_id:
+                    # Same message as the previous turn; reuse the cached text
+                    return self._last_user_text
+                text = _user_item_text(item)
+                if text:
+                    self._last_user_item_id = item_id
+                    self._last_user_text = text
+                    return text
+        except Exception as e:
+            logging.debug("Error checking chat tail for user query: %s", e)
+
+        # No user message near the tail; fall back to the full reversed scan
+        text = _extract_last_user_text(chat_ctx)
+        if text:
+            self._last_user_item_id = None
+            self._last_user_text = text
+        return text
+
+    def _track_announced_phrase(self, message: str):
+        """Remember an announced phrase, evicting the oldest once the LRU is full."""
+        self.announced_phrases[message] = None
+        self.announced_phrases.move_to_end(message)
+        if len(self.announced_phrases) > _MAX_ANNOUNCED_PHRASES:
+            self.announced_phrases.popitem(last=False)
+
+    def _say_fallback(self, activity, text: str):
+        """Speak a constant fallback phrase, replaying cached audio if available.
+
+        The fallback fires on the announcement error path, where paying a full
+        TTS round-trip for the same fixed string every time is pure latency.
+        The first use speaks normally and kicks off one background synthesis;
+        later uses replay the cached frames.
+        """
+        frames = self._fallback_audio.get(text)
+        if frames:
+            async def _replay(frames=frames):
+                for frame in frames:
+                    yield frame
+
+            activity.say(text, audio=_replay())
+            return
+
+        activity.say(text)
+
+        if text not in self._fallback_audio_pending:
+            self._fallback_audio_pending.add(text)
             try:
-                logging.debug(f"[QUERY INTENT] chat_ctx type: {type(chat_ctx)}, has items: {hasattr(chat_ctx, 'items')}")
-                if hasattr(chat_ctx, 'items'):
-                    logging.debug(f"[QUERY INTENT] chat_ctx.items length: {len(chat_ctx.items) if chat_ctx.items else 0}")
-
-                if hasattr(chat_ctx, 'items') and chat_ctx.items:
-                    # Find the last user message
-                    for i, item in enumerate(reversed(chat_ctx.items)):
-                        item_role = getattr(item, 'role', None)
-                        logging.debug(f"[QUERY INTENT] Item {i}: role={item_role}")
-
-                        # Skip non-user items
-                        if item_role != "user":
-                            continue
-
-                        # Found a user item, try to extract content
-                        item_content = getattr(item, 'content', None)
-                        logging.debug(f"[QUERY INTENT] User item content type: {type(item_content)}")
-
-                        if item_content:
-                            if isinstance(item_content, list) and len(item_content) > 0:
-                                logging.debug(f"[QUERY INTENT] Content is list with {len(item_content)} items")
-                                first_content = item_content[0]
-                                logging.debug(f"[QUERY INTENT] First content type: {type(first_content)}")
-
-                                # Extract text - could be a string directly or an object with .text attribute
-                                if isinstance(first_content, str):
-                                    text = first_content
-                                else:
-                                    text = getattr(first_content, 'text', None)
-
-                                logging.debug(f"[QUERY INTENT] Extracted text: {text}")
-                                if text:
-                                    user_query = str(text)
-                                    # Save the user query for subsequent tool calls
-                                    if user_query:
-                                        # If this is a new query, reset the announcement flag
-                                        if user_query != self.current_user_query:
-                                            self.query_intent_announced = False
-                                        self.current_user_query = user_query
-                                    logging.debug(f"[QUERY INTENT] Successfully extracted query: {user_query[:50]}")
-                                    break
-                            elif isinstance(item_content, str):
-                                logging.debug(f"[QUERY INTENT] Content is string: {item_content[:50]}")
-                                user_query = item_content
-                                # Save the user query for subsequent tool calls
-                                if user_query:
-                                    # If this is a new query, reset the announcement flag
-                                    if user_query != self.current_user_query:
-                                        self.query_intent_announced = False
-                                    self.current_user_query = user_query
-                                logging.debug(f"[QUERY INTENT] Successfully extracted query: {user_query[:50]}")
-                                break
-                        else:
-                            logging.debug(f"[QUERY INTENT] User item has no content")
+                task = asyncio.create_task(self._synthesize_fallback_audio(text))
+                self._pending_announcement_tasks.add(task)
+                task.add_done_callback(self._pending_announcement_tasks.discard)
             except Exception as e:
-                logging.debug(f"Error extracting user query: {e}")
-                user_query = ""
-
-            # If we didn't find a user query in this invocation, use the saved one
-            if not user_query and self.current_user_query:
-                user_query = self.current_user_query
-                logging.debug(f"[QUERY INTENT] Using saved user query: {user_query[:50]}")
-            elif user_query:
-                logging.debug(f"[QUERY INTENT] Found new user query: {user_query[:50]}")
+                logging.debug("Could not schedule fallback audio synthesis: %s", e)
+                self._fallback_audio_pending.discard(text)
+
+    async def _synthesize_fallback_audio(self, text: str):
+        """Synthesize and memoize audio frames for a fallback phrase."""
+        try:
+            frames = []
+            async for audio in self.tts.synthesize(text):
+                frames.append(audio.frame)
+            self._fallback_audio[text] = frames
+        except Exception as e:
+            logging.debug("Could not pre-synthesize fallback audio: %s", e)
+            self._fallback_audio_pending.discard(text)
+
+    def _announce_in_background(self, coro, activity, fallback=None):
+        """Generate an announcement in the background and speak it when ready.
+
+        Runs the announcement LLM call as an asyncio.Task so the streaming loop
+        keeps yielding chunks instead of blocking for the full latency of the
+        auxiliary call. The task is kept in a set so it isn't garbage collected
+        before completion.
+        """
+        task = asyncio.create_task(coro)
+        self._pending_announcement_tasks.add(task)
+
+        def _speak_when_done(t: asyncio.Task):
+            self._pending_announcement_tasks.discard(t)
+            try:
+                message = t.result()
+                activity.say(message)
+                logging.debug("[ANNOUNCEMENT] SUCCESS: Said '%s'", message)
+            except Exception as e:
+                logging.error("[ANNOUNCEMENT] ERROR: %s", e, exc_info=True)
+                if fallback:
+                    self._say_fallback(activity, fallback)
+
+        task.add_done_callback(_speak_when_done)
+
+    def _stream_announcement_in_background(self, agen, activity, fallback=None, on_complete=None):
+        """Speak sentences from a streaming announcement generator as they arrive.
+
+        Like _announce_in_background, but consumes an async generator so the
+        first sentence reaches TTS while the announcement LLM is still
+        generating the rest.
+        """
+        async def _consume():
+            spoken = []
+            async for sentence in agen:
+                activity.say(sentence)
+                spoken.append(sentence)
+            if spoken and on_complete:
+                on_complete(" ".join(spoken))
+
+        task = asyncio.create_task(_consume())
+        self._pending_announcement_tasks.add(task)
+
+        def _on_done(t: asyncio.Task):
+            self._pending_announcement_tasks.discard(t)
+            try:
+                t.result()
+            except Exception as e:
+                logging.error("[ANNOUNCEMENT] ERROR: %s", e, exc_info=True)
+                if fallback:
+                    self._say_fallback(activity, fallback)
 
-            # Log that we're starting LLM generation
-            logging.debug(f"[QUERY INTENT] Starting LLM generation for query: {user_query[:100]}")
-            logging.debug(f"[QUERY INTENT] Feature enabled: {self.enable_query_intent_announcement}")
+        task.add_done_callback(_on_done)
 
-            # Get the original response from the default implementation
-            try:
-                chunk_count = 0
-                async for chunk in Agent.default.llm_node(self, chat_ctx, tools, model_settings):
-                    chunk_count += 1
-                    if chunk_count == 1:
-                        logging.debug("Received first chunk from LLM")
-
-                    # Check if this chunk contains a tool call
-                    if isinstance(chunk, ChatChunk) and chunk.delta and chunk.delta.tool_calls:
-                        logging.debug(f"[QUERY INTENT] Tool call detected, announced={self.query_intent_announced}, enabled={self.enable_query_intent_announcement}, has_query={bool(user_query)}")
-
-                        # Announce query intent on first tool call
-                        if not self.query_intent_announced and self.enable_query_intent_announcement and user_query:
-                            self.query_intent_announced = True
-                            logging.debug(f"[QUERY INTENT] Generating announcement...")
-                            try:
-                                # Get list of all tool names from the available tools
-                                tool_names = []
-                                for tool in tools:
-                                    if hasattr(tool, '__livekit_raw_tool_info'):
-                                        info = getattr(tool, '__livekit_raw_tool_info')
-                                        tool_names.append(info.raw_schema.get('name', 'unknown'))
-
-                                logging.debug(f"[QUERY INTENT] Found {len(tool_names)} tools")
-
-                                intent_message = await generate_query_intent_announcement(
+    async def llm_node(self, chat_ctx, tools, model_settings):
+        """Override the llm_node to announce tool calls with natural, LLM-generated messages."""
+        # Fast path: with both announcement features disabled there is
+        # nothing to inspect, so forward chunks without per-chunk work
+        if not self.enable_tool_announcements and not self.enable_query_intent_announcement:
+            async for chunk in FunctionAgent._default_llm_node(self, chat_ctx, tools, model_settings):
+                yield chunk
+            return
+
+        activity = self._get_activity_or_raise()
+
+        # Build tool metadata lookups once per invocation instead of
+        # rescanning the tools list for every streamed chunk
+        tool_names_list = []
+        tool_descriptions = {}
+        for tool in tools:
+            info = getattr(tool, '__livekit_raw_tool_info', None)
+            if info is not None:
+                name = info.raw_schema.get('name', 'unknown')
+                tool_names_list.append(name)
+                tool_descriptions[name] = info.raw_schema.get('description', '')
+
+        # Get the user's last message for context
+        user_query = self._get_last_user_text(chat_ctx)
+        if user_query:
+            # If this is a new query, reset the announcement flag
+            if user_query != self.current_user_query:
+                self.query_intent_announced = False
+            self.current_user_query = user_query
+        elif self.current_user_query:
+            # No user query in this invocation, use the saved one
+            user_query = self.current_user_query
+
+        logging.debug("[QUERY INTENT] Starting LLM generation for query: %.100s", user_query)
+
+        # Lift frequently-read attributes into locals; the chunk loop
+        # below can run hundreds of times per streamed turn
+        enable_tool = self.enable_tool_announcements
+        enable_intent = self.enable_query_intent_announcement
+        ann_model = self.announcement_model
+        ann_temp = self.announcement_temperature
+        intent_announced = self.query_intent_announced
+        announced_tools = set() if enable_tool else None
+
+        # Get the original response from the default implementation
+        try:
+            chunk_count = 0
+            async for chunk in FunctionAgent._default_llm_node(self, chat_ctx, tools, model_settings):
+                chunk_count += 1
+                if chunk_count == 1:
+                    logging.debug("Received first chunk from LLM")
+
+                # Check if this chunk contains a tool call
+                if isinstance(chunk, ChatChunk) and chunk.delta and chunk.delta.tool_calls:
+                    logging.debug("[QUERY INTENT] Tool call detected, announced=%s, enabled=%s, has_query=%s", intent_announced, enable_intent, bool(user_query))
+
+                    # Announce query intent on first tool call. When tool
+                    # announcements are also enabled, the intent is folded
+                    # into a single combined LLM call in the loop below.
+                    if not intent_announced and enable_intent and user_query and not enable_tool:
+                        intent_announced = True
+                        self.query_intent_announced = True
+                        logging.debug("[QUERY INTENT] Generating announcement...")
+                        try:
+                            logging.debug("[QUERY INTENT] Found %d tools", len(tool_names_list))
+
+                            # Fire the generation as a background task so the
+                            # streaming loop keeps yielding chunks immediately,
+                            # speaking each sentence as soon as it is ready
+                            self._stream_announcement_in_background(
+                                generate_query_intent_announcement_stream(
                                     user_query=user_query,
-                                    tools_involved=tool_names,
-                                    model=self.announcement_model,
-                                    temperature=self.announcement_temperature
-                                )
-                                logging.debug(f"[QUERY INTENT] Generated message: {intent_message}")
-                                activity.say(intent_message)
-                                logging.debug(f"[QUERY INTENT] SUCCESS: Said '{intent_message}'")
-                            except Exception as e:
-                                logging.error(f"[QUERY INTENT] ERROR: {e}", exc_info=True)
-                        else:
-                            if self.query_intent_announced:
-                                logging.debug(f"[QUERY INTENT] Already announced")
-                            elif not self.enable_query_intent_announcement:
-                                logging.debug(f"[QUERY INTENT] Feature is disabled")
-                            elif not user_query:
-                                logging.debug(f"[QUERY INTENT] No user query extracted")
-
+                                    tools_involved=tool_names_list,
+                                    model=ann_model,
+                                    temperature=ann_temp
+                                ),
+                                activity
+                            )
+                        except Exception as e:
+                            logging.error("[QUERY INTENT] ERROR: %s", e, exc_info=True)
+
+                    # With tool announcements disabled, skip per-tool-call
+                    # name extraction and dedup work entirely
+                    if enable_tool:
                         for tool_call in chunk.delta.tool_calls:
                             tool_name = getattr(tool_call, 'name', None)
 
                             # Only announce each tool once
                             if tool_name and tool_name not in announced_tools:
                                 announced_tools.add(tool_name)
-                                logging.debug(f"[TOOL ANNOUNCEMENT] Processing tool: {tool_name}, enabled={self.enable_tool_announcements}")
+                                logging.debug("[TOOL ANNOUNCEMENT] Processing tool: %s", tool_name)
 
-                                # Extract tool arguments and description for announcements
+                                # Extract tool arguments for announcements
                                 tool_arguments = {}
-                                tool_description = ""
-
-                                if self.enable_tool_announcements:
-                                    try:
-                                        # Try to get arguments from the tool call
-                                        raw_arguments = getattr(tool_call, 'raw_arguments', None)
-                                        logging.debug(f"[TOOL ANNOUNCEMENT] raw_arguments type: {type(raw_arguments)}, value: {raw_arguments}")
-                                        if raw_arguments:
-                                            if isinstance(raw_arguments, str):
-                                                tool_arguments = json.loads(raw_arguments)
-                                            elif isinstance(raw_arguments, dict):
-                                                tool_arguments = raw_arguments
-                                            logging.debug(f"[TOOL ANNOUNCEMENT] Parsed arguments: {tool_arguments}")
-                                        else:
-                                            logging.debug(f"[TOOL ANNOUNCEMENT] No arguments available yet for {tool_name}")
-                                    except Exception as e:
-                                        logging.error(f"[TOOL ANNOUNCEMENT] Could not extract tool arguments: {e}", exc_info=True)
-
-                                    try:
-                                        # Try to get tool description from the tools list
-                                        for tool in tools:
-                                            if hasattr(tool, '__livekit_raw_tool_info'):
-                                                info = getattr(tool, '__livekit_raw_tool_info')
-                                                if info.raw_schema.get('name') == tool_name:
-                                                    tool_description = info.raw_schema.get('description', '')
-                                                    break
-                                    except Exception as e:
-                                        logging.debug(f"Could not extract tool description: {e}")
-
-                                    logging.debug(f"[TOOL ANNOUNCEMENT] Generating announcement for {tool_name}")
-                                    logging.debug(f"[TOOL ANNOUNCEMENT] Args: {tool_arguments}, Desc: {tool_description[:50] if tool_description else 'none'}")
-
-                                    # Generate a natural message using the LLM
-                                    try:
-                                        message = await generate_tool_announcement(
+                                try:
+                                    # Try to get arguments from the tool call
+                                    raw_arguments = getattr(tool_call, 'raw_arguments', None)
+                                    if raw_arguments:
+                                        if isinstance(raw_arguments, (str, bytes, bytearray)):
+                                            tool_arguments = _json_loads(raw_arguments)
+                                        elif isinstance(raw_arguments, dict):
+                                            tool_arguments = raw_arguments
+                                        logging.debug("[TOOL ANNOUNCEMENT] Parsed arguments: %s", tool_arguments)
+                                    else:
+                                        logging.debug("[TOOL ANNOUNCEMENT] No arguments available yet for %s", tool_name)
+                                except Exception as e:
+                                    logging.error("[TOOL ANNOUNCEMENT] Could not extract tool arguments: %s", e, exc_info=True)
+
+                                # Look up the tool description from the prebuilt map
+                                tool_description = tool_descriptions.get(tool_name, '')
+
+                                logging.debug("[TOOL ANNOUNCEMENT] Generating announcement for %s", tool_name)
+
+                                if not intent_announced and enable_intent and user_query:
+                                    # First tool call with the intent still
+                                    # pending: one combined LLM call returns
+                                    # both phrases instead of two round-trips
+                                    intent_announced = True
+                                    self.query_intent_announced = True
+
+                                    async def _announce_combined(
+                                        tool_name=tool_name,
+                                        tool_description=tool_description,
+                                        tool_arguments=tool_arguments
+                                    ):
+                                        combined = await generate_combined_announcements(
                                             user_query=user_query,
                                             tool_name=tool_name,
                                             tool_description=tool_description,
                                             tool_arguments=tool_arguments,
-                                            previously_announced=self.announced_phrases,
-                                            model=self.announcement_model,
-                                            temperature=self.announcement_temperature
+                                            tools_involved=tool_names_list,
+                                            previously_announced=list(self.announced_phrases),
+                                            model=ann_model,
+                                            temperature=ann_temp
                                         )
 
-                                        # Track this phrase to avoid repeating it
-                                        self.announced_phrases.add(message)
-
-                                        activity.say(message)
-                                        logging.debug(f"[TOOL ANNOUNCEMENT] SUCCESS: Said '{message}'")
-                                    except Exception as e:
-                                        logging.error(f"[TOOL ANNOUNCEMENT] ERROR: {e}", exc_info=True)
-                                        activity.say("Let me check that for you.")
-                                else:
-                                    logging.debug(f"[TOOL ANNOUNCEMENT] Skipped (disabled) for {tool_name}")
+                                        intent_message = combined.get("intent")
+                                        if intent_message:
+                                            activity.say(intent_message)
+
+                                        message = combined.get("tool") or "Let me check that for you."
+                                        self._track_announced_phrase(message)
+                                        return message
+
+                                    self._announce_in_background(
+                                        _announce_combined(),
+                                        activity,
+                                        fallback="Let me check that for you."
+                                    )
+                                    continue
+
+                                # Generate a natural message using the LLM in
+                                # the background, speaking each sentence as it
+                                # arrives so streaming is never blocked on it
+                                self._stream_announcement_in_background(
+                                    generate_tool_announcement_stream(
+                                        user_query=user_query,
+                                        tool_name=tool_name,
+                                        tool_description=tool_description,
+                                        tool_arguments=tool_arguments,
+                                        previously_announced=list(self.announced_phrases),
+                                        model=ann_model,
+                                        temperature=ann_temp
+                                    ),
+                                    activity,
+                                    fallback="Let me check that for you.",
+                                    on_complete=self._track_announced_phrase
+                                )
 
-                    yield chunk
+                yield chunk
 
-                logging.debug(f"LLM generation completed, yielded {chunk_count} chunks")
+            logging.debug("LLM generation completed, yielded %d chunks", chunk_count)
 
-            except Exception as e:
-                logging.error(f"Error in llm_node: {e}", exc_info=True)
-                raise
+        except Exception as e:
+            logging.error("Error in llm_node: %s", e, exc_info=True)
+            raise
 
-        return _llm_node_impl()
 
 
 async def entrypoint(ctx: JobContext):
@@ -286,8 +482,8 @@ async def entrypoint(ctx: JobContext):
     enable_natural_language = os.environ.get("ENABLE_NATURAL_LANGUAGE", "true").lower() == "true"
 
     # Model configuration for announcements
-    announcement_model = os.environ.get("ANNOUNCEMENT_MODEL", "gpt-4o")
-    announcement_temperature = float(os.environ.get("ANNOUNCEMENT_TEMPERATURE", "0.9"))
+    announcement_model = os.environ.get("ANNOUNCEMENT_MODEL", "gpt-4o-mini")
+    announcement_temperature = float(os.environ.get("ANNOUNCEMENT_TEMPERATURE", "0.4"))
     batch_window_seconds = float(os.environ.get("BATCH_WINDOW_SECONDS", "5.0"))
 
     # Create server using the universal adaptor
@@ -325,6 +521,16 @@ async def entrypoint(ctx: JobContext):
         progress_manager=progress_manager
     )
 
+    # Start the MCP handshake now so it overlaps with agent construction
+    # and the LiveKit room connect below. Prefetching the tool list as part
+    # of the same task means the session and wrapped tools are fully warm
+    # before the first user turn instead of paying those round-trips lazily.
+    async def _init_mcp():
+        await wrapped_server.initialize()
+        await wrapped_server.list_tools()
+
+    mcp_init_task = asyncio.create_task(_init_mcp())
+
     # Create the agent with the wrapped MCP server
     agent = FunctionAgent(
         mcp_servers=[wrapped_server],
@@ -341,7 +547,8 @@ async def entrypoint(ctx: JobContext):
                 agent._activity.say(text)
         speak_callback_ref["callback"] = agent_speak_callback
 
-    await ctx.connect()
+    # Overlap room connect with the in-flight MCP initialization
+    await asyncio.gather(ctx.connect(), mcp_init_task)
 
     # Create session with increased max_tool_steps
     session = AgentSession(max_tool_steps=10)
@@ -1,16 +1,37 @@
 """MCP Client integration for LiveKit Agents."""
 
-from .server import MCPServerConfig, create_mcp_server
+from .server import (
+    MCPServerConfig,
+    create_mcp_server,
+    release_mcp_server,
+    close_mcp_server_pool,
+)
 from .wrapper import MCPServerWrapper
 from .progress_manager import ProgressManager
-from .announcements import generate_tool_announcement, generate_progress_announcement, generate_query_intent_announcement
+from .announcements import (
+    generate_tool_announcement,
+    generate_tool_announcement_stream,
+    generate_tool_announcement_batched,
+    generate_progress_announcement,
+    generate_query_intent_announcement,
+    generate_query_intent_announcement_stream,
+    generate_combined_announcements,
+    close_announcement_client,
+)
 
 __all__ = [
     "MCPServerConfig",
     "create_mcp_server",
+    "release_mcp_server",
+    "close_mcp_server_pool",
     "MCPServerWrapper",
     "ProgressManager",
     "generate_tool_announcement",
+    "generate_tool_announcement_stream",
+    "generate_tool_announcement_batched",
     "generate_progress_announcement",
     "generate_query_intent_announcement",
+    "generate_query_intent_announcement_stream",
+    "generate_combined_announcements",
+    "close_announcement_client",
 ]
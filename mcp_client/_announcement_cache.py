@@ -0,0 +1,199 @@
+"""Response cache for announcement generation.
+
+Repeated tool calls often re-announce the same (tool, arguments) pair within
+seconds. Caching the generated phrase skips the OpenAI round trip entirely,
+saving hundreds of milliseconds of spoken-response latency per hit.
+
+Two tiers:
+
+1. Exact tier: an LRU + TTL map keyed on a canonical hash of the prompt
+   inputs (tool name, description, sorted arguments, model, temperature).
+2. Optional semantic tier: cosine similarity over OpenAI embeddings of the
+   user query, so near-duplicate phrasings ("sales for Jerry" vs "Jerry's
+   sales") also hit. Requires numpy and is off by default; enable with
+   ANNOUNCEMENT_SEMANTIC_CACHE=true.
+
+High-temperature generations are intentionally varied, so the cache is
+bypassed when temperature >= 0.7 unless ANNOUNCEMENT_CACHE_ALL=true.
+"""
+
+import os
+import json
+import time
+import asyncio
+import hashlib
+import logging
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# orjson's C serializer is several times faster than stdlib json for the
+# small/medium dicts hashed here; fall back to stdlib when not installed
+try:
+    import orjson
+
+    def _canonical_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+except ImportError:
+    def _canonical_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode()
+
+# numpy is only needed for the semantic tier
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+_CACHE_MAX_ENTRIES = 512
+_CACHE_TTL_SECONDS = 300.0
+
+# Above this temperature the caller wants varied output; serving a cached
+# phrase would defeat that, so skip the cache unless explicitly opted in
+_TEMPERATURE_BYPASS = 0.7
+
+_SEMANTIC_THRESHOLD = 0.93
+_SEMANTIC_MAX_ENTRIES = 128
+_EMBEDDING_MODEL = "text-embedding-3-small"
+
+# key -> (timestamp, text); ordered oldest-first for LRU eviction
+_exact_cache: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
+_exact_lock = asyncio.Lock()
+
+# namespace -> list of (timestamp, embedding, text)
+_semantic_cache: Dict[str, List[Tuple[float, Any, str]]] = {}
+_semantic_lock = asyncio.Lock()
+
+
+def _canonical_key(*parts: Any) -> bytes:
+    """Hash arbitrary prompt inputs into a stable cache key.
+
+    blake2b is C-implemented and faster than sha256 at the 16-byte digest
+    size needed for a cache key.
+    """
+    return hashlib.blake2b(_canonical_dumps(parts), digest_size=16).digest()
+
+
+def cache_bypassed(temperature: float) -> bool:
+    """Whether caching should be skipped for this temperature."""
+    if temperature < _TEMPERATURE_BYPASS:
+        return False
+    return os.environ.get("ANNOUNCEMENT_CACHE_ALL", "").lower() not in ("true", "1", "yes")
+
+
+def make_tool_key(
+    tool_name: str,
+    tool_description: str,
+    tool_arguments: Dict[str, Any],
+    model: str,
+    temperature: float
+) -> bytes:
+    """Build the exact-tier key for a tool announcement."""
+    return _canonical_key(
+        "tool",
+        tool_name,
+        tool_description,
+        sorted(tool_arguments.items(), key=lambda kv: kv[0]),
+        model,
+        round(temperature, 1),
+    )
+
+
+def make_progress_key(
+    messages: List[str],
+    model: str,
+    temperature: float
+) -> bytes:
+    """Build the exact-tier key for a progress announcement batch."""
+    return _canonical_key("progress", messages, model, round(temperature, 1))
+
+
+async def get_cached(key: bytes) -> Optional[str]:
+    """Return the cached text for key, or None if missing/expired."""
+    now = time.monotonic()
+    async with _exact_lock:
+        entry = _exact_cache.get(key)
+        if entry is None:
+            return None
+        ts, text = entry
+        if now - ts > _CACHE_TTL_SECONDS:
+            del _exact_cache[key]
+            return None
+        _exact_cache.move_to_end(key)
+        return text
+
+
+async def put_cached(key: bytes, text: str) -> None:
+    """Store text under key, evicting the oldest entry when full."""
+    async with _exact_lock:
+        _exact_cache[key] = (time.monotonic(), text)
+        _exact_cache.move_to_end(key)
+        while len(_exact_cache) > _CACHE_MAX_ENTRIES:
+            _exact_cache.popitem(last=False)
+
+
+def semantic_enabled() -> bool:
+    """Whether the embedding-similarity tier is available and opted in."""
+    if _np is None:
+        return False
+    return os.environ.get("ANNOUNCEMENT_SEMANTIC_CACHE", "").lower() in ("true", "1", "yes")
+
+
+async def _embed(text: str):
+    """Embed text with OpenAI; returns a unit-norm numpy vector or None."""
+    try:
+        from .announcements import _get_client
+        client = _get_client()
+        response = await client.embeddings.create(model=_EMBEDDING_MODEL, input=text)
+        vector = _np.asarray(response.data[0].embedding, dtype=_np.float32)
+        norm = _np.linalg.norm(vector)
+        if norm == 0:
+            return None
+        return vector / norm
+    except Exception as e:
+        logger.debug("Embedding for semantic cache failed: %s", e)
+        return None
+
+
+async def get_semantic(namespace: str, query: str) -> Optional[str]:
+    """Return a cached text whose query embedding is close to this one."""
+    if not semantic_enabled():
+        return None
+    vector = await _embed(query)
+    if vector is None:
+        return None
+    now = time.monotonic()
+    async with _semantic_lock:
+        entries = _semantic_cache.get(namespace)
+        if not entries:
+            return None
+        # Drop expired entries in place, then cosine-match the rest
+        entries[:] = [e for e in entries if now - e[0] <= _CACHE_TTL_SECONDS]
+        best_text = None
+        best_score = _SEMANTIC_THRESHOLD
+        for _, cached_vector, text in entries:
+            score = float(vector @ cached_vector)
+            if score >= best_score:
+                best_score = score
+                best_text = text
+        return best_text
+
+
+async def put_semantic(namespace: str, query: str, text: str) -> None:
+    """Store text under the query's embedding for near-duplicate matching."""
+    if not semantic_enabled():
+        return
+    vector = await _embed(query)
+    if vector is None:
+        return
+    async with _semantic_lock:
+        entries = _semantic_cache.setdefault(namespace, [])
+        entries.append((time.monotonic(), vector, text))
+        if len(entries) > _SEMANTIC_MAX_ENTRIES:
+            del entries[0]
+
+
+def clear_cache() -> None:
+    """Drop all cached announcements (both tiers)."""
+    _exact_cache.clear()
+    _semantic_cache.clear()
@@ -1,11 +1,229 @@
 """Natural language announcement generation using LLM."""
 
 import os
+import re
+import json
+import asyncio
 import logging
-from typing import Set, Optional, Dict, Any, List, Union
+from typing import AsyncIterator, Set, Optional, Dict, Any, List, Union
+
+from . import _announcement_cache
 
 logger = logging.getLogger(__name__)
 
+# Shared AsyncOpenAI client. Creating one per call rebuilds the underlying
+# httpx pool and TLS context every time; a singleton keeps connections
+# alive across announcements.
+_client = None
+_http_client = None
+
+
+def _get_client():
+    """Return the module-level AsyncOpenAI client, creating it on first use.
+
+    The underlying httpx pool is sized for concurrent tool fan-out and uses
+    HTTP/2 when the optional h2 package is installed, multiplexing parallel
+    announcement and progress calls over a single TLS connection.
+    """
+    global _client, _http_client
+    if _client is None:
+        import httpx
+        from openai import AsyncOpenAI
+        limits = httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=32,
+            keepalive_expiry=60.0,
+        )
+        timeout = httpx.Timeout(10.0, connect=2.0)
+        try:
+            _http_client = httpx.AsyncClient(http2=True, limits=limits, timeout=timeout)
+        except ImportError:
+            # h2 not installed; HTTP/1.1 with keep-alive still avoids
+            # per-call handshakes
+            _http_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        _client = AsyncOpenAI(
+            api_key=os.environ.get("OPENAI_API_KEY"),
+            max_retries=1,
+            http_client=_http_client,
+        )
+    return _client
+
+
+# Cap concurrent announcement completions so a burst of simultaneous tool
+# calls queues briefly instead of stampeding into OpenAI rate limits (which
+# would surface as the generic fallback phrase)
+_ANNOUNCE_SEM = asyncio.Semaphore(8)
+
+
+async def close_announcement_client() -> None:
+    """Close the shared client and its connection pool (call at shutdown)."""
+    global _client, _http_client
+    if _client is not None:
+        await _client.close()
+        _client = None
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+# Sentence boundary for streaming announcements, compiled once at import
+_SENT_END = re.compile(r"[.?!]\s*$")
+
+# Static instruction blocks sent as the system message. OpenAI's automatic
+# prompt caching only hits on exact prefix matches, so all rules and examples
+# live here unchanged between calls and the dynamic fields (user query, tool
+# details, avoid-lists) go in the short user message that follows.
+_SYSTEM_PROMPT_METADATA_TOOL = """You're helping someone and doing background prep work before answering.
+
+You're calling a technical tool to gather metadata needed to answer properly.
+
+Say something VERY brief (4-8 words) that sounds like you're thinking/working:
+
+Examples:
+- "OK, I'm just gathering some information"
+- "I'm just gathering some general information"
+- "Bear with me, I won't be long"
+- "Let me see"
+
+Respond with the phrase only (4-8 words)."""
+
+_SYSTEM_PROMPT_DATA_TOOL = """You are a helpful voice assistant about to call a tool to get the user's answer.
+
+CRITICAL: If there are specific parameters (like a person's name, date, store name, etc.), MENTION THEM in your response!
+Be SPECIFIC - don't just say "fetching data", say WHAT you're fetching and FOR WHOM/WHAT.
+
+Generate a brief, natural phrase (6-12 words max) that:
+1. Mentions any specific names, dates, or identifiers from the parameters
+2. Connects to what the user asked for
+3. Sounds like casual speech, not a technical description
+
+Good examples (notice the specifics):
+- "I'm looking up Jerry Lewis's transaction details"
+- "OK, now I'm checking Barry White's sales numbers now"
+- "Thanks for your patience. Now I'm getting the data for Tony Goldsmith"
+- "OK, now I'm looking up last week's numbers for the London store"
+- "Nearly there! Just pulling up Sarah's performance metrics"
+
+Bad examples (too generic):
+- "Fetching that data for you"
+- "Retrieving the information"
+- "Getting those details"
+
+Respond with just the phrase, nothing else."""
+
+_SYSTEM_PROMPT_PROGRESS = """You're helping someone and giving them quick casual updates while you work.
+
+Turn the system message(s) into a super casual, natural spoken update (3-6 words max).
+Talk like you're thinking out loud while working, NOT like you're reading a procedure manual.
+Be LAZY with words - just mention the overall progress, don't narrate every step.
+
+DO (casual, minimal):
+- "Got it"
+- "Hmm, lots of rows"
+- "Okay, comparing now"
+- "Almost there"
+- "Just checking something"
+
+DON'T (too formal/procedural):
+- "Gathering all sales records"
+- "Calculating the total sales figure"
+- "Finalizing the analysis"
+- "Diving into the details"
+- "Let's break down these rows"
+
+Just say what you're actually seeing/doing right now (3-6 words)."""
+
+_SYSTEM_PROMPT_INTENT = """You are a helpful voice assistant about to work through the user's request.
+
+Generate a brief, natural opening statement (12-15 words) that:
+1. Acknowledges what you're about to do
+2. Sounds confident and helpful
+3. Uses phrases like "OK, I'm going to...", "Let me...", "I'll...", "Alright, I'll..."
+4. Mentions the key task in a natural way
+
+Be specific about what you'll do, but keep it conversational and friendly.
+
+Examples:
+- "OK, I'm going to work through projecting the sales performance for you"
+- "Let me analyze the year-over-year trends across all stores"
+- "Alright, I'll compare this year's numbers to last year"
+- "OK, let me pull together those sales figures for you"
+- "I'll work through the store rankings based on that data"
+
+Respond with just the opening statement, nothing else."""
+
+_SYSTEM_PROMPT_BATCH = """You are a helpful voice assistant announcing several tool calls you are about to make.
+
+For EACH numbered tool below, generate a brief, natural phrase (6-12 words) that:
+1. Mentions any specific names, dates, or identifiers from the parameters
+2. Connects to what the user asked for
+3. Sounds like casual speech, not a technical description
+
+Make the phrases different from each other so they flow naturally when spoken in sequence.
+
+Respond with ONLY a JSON object like: {"phrases": ["...", "..."]} with exactly one phrase per numbered tool, in order."""
+
+# Argument keys worth surfacing in announcements, in mention order, plus
+# frozenset views for O(1) membership tests in the extraction pass
+_PRIORITY_KEYS = ('name', 'person', 'salesperson', 'sales_person', 'store', 'product',
+                  'customer', 'employee', 'user', 'id', 'date', 'period', 'year')
+_PRIORITY_SET = frozenset(_PRIORITY_KEYS)
+
+# Very generic keys that add nothing to a spoken announcement
+_SKIP_SET = frozenset(('subject', 'select', 'format', 'limit'))
+
+# At most this many parameters are mentioned in a tool announcement
+_MAX_SPECIFIC_VALUES = 5
+
+# Schema/metadata tools get a terse "one moment" style announcement rather
+# than a narrated description of the technical step
+_METADATA_TOOLS = frozenset(('get_schema', 'get_financial_periods', 'get_calendar_period_date_range'))
+
+# Canned filler for metadata tools. The LLM is constrained to 4-8 words
+# from essentially this set anyway, so rotating through it directly costs
+# nothing and saves a full OpenAI round trip per metadata call
+_METADATA_PHRASES = (
+    "OK, I'm just gathering some information",
+    "I'm just gathering some general information",
+    "Bear with me, I won't be long",
+    "Let me see",
+    "One moment",
+)
+
+
+def _pick_metadata_phrase(tool_name: str, previously_announced: Set[str]) -> str:
+    """Pick a canned metadata phrase, avoiding recently announced ones."""
+    start = hash(tool_name) % len(_METADATA_PHRASES)
+    for offset in range(len(_METADATA_PHRASES)):
+        phrase = _METADATA_PHRASES[(start + offset) % len(_METADATA_PHRASES)]
+        if phrase not in previously_announced:
+            return phrase
+    return _METADATA_PHRASES[start]
+
+
+async def _stream_sentences(stream) -> AsyncIterator[str]:
+    """Yield sentence-sized chunks from a streaming chat completion.
+
+    Buffers delta tokens and emits a chunk as soon as a sentence boundary
+    appears, so TTS can start on the first sentence while the model is
+    still generating the rest.
+    """
+    buffer = ""
+    async for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+        buffer += delta
+        if _SENT_END.search(buffer):
+            sentence = buffer.strip().strip('"').strip("'")
+            if sentence:
+                yield sentence
+            buffer = ""
+
+    tail = buffer.strip().strip('"').strip("'")
+    if tail:
+        yield tail
+
 
 async def generate_tool_announcement(
     user_query: str,
@@ -13,7 +231,7 @@ async def generate_tool_announcement(
     tool_description: str = "",
     tool_arguments: Optional[Dict[str, Any]] = None,
     previously_announced: Optional[Set[str]] = None,
-    model: str = "gpt-4o",
+    model: str = "gpt-4o-mini",
     temperature: float = 0.9,
     max_tokens: int = 35
 ) -> str:
@@ -25,7 +243,7 @@ async def generate_tool_announcement(
         tool_description: Description of what the tool does
         tool_arguments: Arguments being passed to the tool
         previously_announced: Set of phrases already announced (to avoid repetition)
-        model: LLM model to use (default: gpt-4o)
+        model: LLM model to use (default: gpt-4o-mini)
         temperature: LLM temperature (default: 0.9 for variety)
         max_tokens: Maximum tokens to generate (default: 35)
 
@@ -37,120 +255,430 @@ async def generate_tool_announcement(
     if tool_arguments is None:
         tool_arguments = {}
 
+    # Metadata tools only warrant canned filler; skip the LLM entirely
+    if tool_name.lower() in _METADATA_TOOLS:
+        return _pick_metadata_phrase(tool_name, previously_announced)
+
     try:
-        # Add context about previously announced phrases to avoid repetition
-        avoid_phrases = ""
-        if previously_announced:
-            avoid_phrases = "\n\nIMPORTANT: You've already said these phrases in this conversation, so say something DIFFERENT:\n" + "\n".join([f"- {phrase}" for phrase in previously_announced])
+        # Check the response cache before paying for an LLM round trip
+        cache_key = None
+        if not _announcement_cache.cache_bypassed(temperature):
+            cache_key = _announcement_cache.make_tool_key(
+                tool_name, tool_description, tool_arguments, model, temperature
+            )
+            cached = await _announcement_cache.get_cached(cache_key)
+            if cached is None:
+                cached = await _announcement_cache.get_semantic(tool_name, user_query)
+            if cached is not None and cached not in previously_announced:
+                return cached
+
+        messages = _build_tool_prompt(
+            user_query, tool_name, tool_description, tool_arguments, previously_announced
+        )
 
-        # Add tool details for more specific announcements
-        tool_details = f"\n\nTool details:\n- Name: {tool_name}"
-        if tool_description:
-            tool_details += f"\n- Purpose: {tool_description}"
+        # Use OpenAI to generate the response
+        client = _get_client()
+
+        async with _ANNOUNCE_SEM:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                # Route repeated calls for the same tool to the same cache shard
+                extra_body={"prompt_cache_key": f"announce-{tool_name}"}
+            )
 
-        # Extract the most specific/meaningful arguments to mention
-        specific_values = []
-        if tool_arguments:
-            # Prioritize human-readable values like names, dates, specific filters
-            priority_keys = ['name', 'person', 'salesperson', 'sales_person', 'store', 'product',
-                           'customer', 'employee', 'user', 'id', 'date', 'period', 'year']
+        result = response.choices[0].message.content
+        if result:
+            result = result.strip()
+            # Remove quotes if the LLM added them
+            result = result.strip('"').strip("'")
+            if cache_key is not None:
+                await _announcement_cache.put_cached(cache_key, result)
+                await _announcement_cache.put_semantic(tool_name, user_query, result)
+            return result
+        else:
+            return "Let me check that for you."
+
+    except Exception as e:
+        logger.warning(f"Error generating tool announcement: {e}")
+        return "Let me check that for you."
 
-            # First add priority keys if they exist
-            for key in priority_keys:
-                if key in tool_arguments and tool_arguments[key]:
-                    specific_values.append(f"{key}: {tool_arguments[key]}")
 
-            # Then add other meaningful keys (skip very generic ones)
-            skip_keys = ['subject', 'select', 'format', 'limit']
+async def generate_tool_announcement_stream(
+    user_query: str,
+    tool_name: str,
+    tool_description: str = "",
+    tool_arguments: Optional[Dict[str, Any]] = None,
+    previously_announced: Optional[Set[str]] = None,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.9,
+    max_tokens: int = 35
+) -> AsyncIterator[str]:
+    """Stream a tool announcement sentence by sentence.
+
+    Same prompt as generate_tool_announcement, but yields each sentence as
+    soon as its boundary appears in the token stream so TTS can begin
+    speaking before the LLM finishes generating.
+    """
+    if previously_announced is None:
+        previously_announced = set()
+    if tool_arguments is None:
+        tool_arguments = {}
+
+    # Metadata tools only warrant canned filler; skip the LLM entirely
+    if tool_name.lower() in _METADATA_TOOLS:
+        yield _pick_metadata_phrase(tool_name, previously_announced)
+        return
+
+    try:
+        messages = _build_tool_prompt(
+            user_query, tool_name, tool_description, tool_arguments, previously_announced
+        )
+
+        client = _get_client()
+
+        async with _ANNOUNCE_SEM:
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                extra_body={"prompt_cache_key": f"announce-{tool_name}"}
+            )
+
+        spoke = False
+        async for sentence in _stream_sentences(stream):
+            spoke = True
+            yield sentence
+        if not spoke:
+            yield "Let me check that for you."
+
+    except Exception as e:
+        logger.warning(f"Error streaming tool announcement: {e}")
+        yield "Let me check that for you."
+
+
+def _build_tool_prompt(
+    user_query: str,
+    tool_name: str,
+    tool_description: str,
+    tool_arguments: Dict[str, Any],
+    previously_announced: Set[str]
+) -> List[Dict[str, str]]:
+    """Build the chat messages for a tool announcement.
+
+    The static instruction block leads as the system message so repeated
+    calls share a cacheable prompt prefix; only the short user message varies.
+    """
+    # Add context about previously announced phrases to avoid repetition
+    avoid_phrases = ""
+    if previously_announced:
+        avoid_phrases = "\n\nIMPORTANT: You've already said these phrases in this conversation, so say something DIFFERENT:\n" + "\n".join([f"- {phrase}" for phrase in previously_announced])
+
+    # Add tool details for more specific announcements
+    tool_details = f"\n\nTool details:\n- Name: {tool_name}"
+    if tool_description:
+        tool_details += f"\n- Purpose: {tool_description}"
+
+    # Extract the most specific/meaningful arguments to mention
+    specific_values = []
+    if tool_arguments:
+        # Prioritize human-readable values like names, dates, specific filters
+        for key in _PRIORITY_KEYS:
+            if tool_arguments.get(key):
+                specific_values.append(f"{key}: {tool_arguments[key]}")
+                if len(specific_values) == _MAX_SPECIFIC_VALUES:
+                    break
+
+        # Then add other meaningful keys (skip very generic ones)
+        if len(specific_values) < _MAX_SPECIFIC_VALUES:
             for key, value in tool_arguments.items():
-                if value and key not in skip_keys and key not in priority_keys:
+                if value and key not in _SKIP_SET and key not in _PRIORITY_SET:
                     # Limit long values
                     val_str = str(value)
                     if len(val_str) > 50:
                         val_str = val_str[:50] + "..."
                     specific_values.append(f"{key}: {val_str}")
+                    if len(specific_values) == _MAX_SPECIFIC_VALUES:
+                        break
 
-            if specific_values:
-                tool_details += f"\n- Specific parameters:\n  " + "\n  ".join(specific_values[:5])  # Top 5 most relevant
+        if specific_values:
+            tool_details += "\n- Specific parameters:\n  " + "\n  ".join(specific_values)
 
-        # Check if this looks like a schema/metadata tool (don't announce these verbosely)
-        is_metadata_tool = tool_name.lower() in ['get_schema', 'get_financial_periods', 'get_calendar_period_date_range']
+    # Check if this looks like a schema/metadata tool (don't announce these verbosely)
+    if tool_name.lower() in _METADATA_TOOLS:
+        # For metadata tools, just say "one moment" or similar - don't narrate technical steps
+        system_prompt = _SYSTEM_PROMPT_METADATA_TOOL
+        user_prompt = f"""The user asked: "{user_query}"
 
-        if is_metadata_tool:
-            # For metadata tools, just say "one moment" or similar - don't narrate technical steps
-            prompt = f"""You're helping someone and doing background prep work before answering.
+You're calling a technical tool ({tool_name})."""
+    else:
+        # For actual data tools, be more descriptive
+        system_prompt = _SYSTEM_PROMPT_DATA_TOOL
+        user_prompt = f"""The user just asked: "{user_query}"{tool_details}{avoid_phrases}"""
 
-The user asked: "{user_query}"
+    return [
+        {"role": "system", "content": system_prompt},
+        {"role": "user", "content": user_prompt},
+    ]
 
-You're calling a technical tool ({tool_name}) to gather metadata needed to answer properly.
 
-Say something VERY brief (4-8 words) that sounds like you're thinking/working:
+class _AnnouncementBatcher:
+    """Coalesces near-simultaneous tool announcements into one LLM call.
 
-Examples:
-- "OK, I'm just gathering some information"
-- "I'm just gathering some general information"
-- "Bear with me, I won't be long"
-- "Let me see"
+    When an agent step fires N tools at once, issuing N separate
+    chat.completions calls costs N round trips and N prompt payloads. The
+    batcher holds requests for a short window (or until the batch fills)
+    and resolves them all from a single JSON-mode completion, fanning the
+    phrases back to the awaiting futures.
+    """
 
-Your response (4-8 words only):"""
-        else:
-            # For actual data tools, be more descriptive
-            prompt = f"""You are a helpful voice assistant. The user just asked: "{user_query}"
+    def __init__(self, max_batch_size: int = 4, batch_window_seconds: float = 0.05):
+        self.max_batch_size = max_batch_size
+        self.batch_window_seconds = batch_window_seconds
+        self._pending: List[tuple] = []  # (request dict, Future)
+        self._flush_task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def submit(self, request: Dict[str, Any]) -> str:
+        """Queue a tool-announcement request and await its phrase."""
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+        return await future
+
+    def _flush(self):
+        """Dispatch everything pending right now."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run_batch(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.batch_window_seconds)
+        self._flush_task = None
+        batch, self._pending = self._pending, []
+        if batch:
+            await self._run_batch(batch)
+
+    async def _run_batch(self, batch: List[tuple]):
+        """Resolve a batch of requests with a single LLM call."""
+        # A lone request gains nothing from the batch prompt; use the
+        # normal single-tool path (which also hits the response cache)
+        if len(batch) == 1:
+            request, future = batch[0]
+            try:
+                result = await generate_tool_announcement(**request)
+                if not future.done():
+                    future.set_result(result)
+            except Exception as e:
+                logger.warning(f"Error generating batched announcement: {e}")
+                if not future.done():
+                    future.set_result("Let me check that for you.")
+            return
+
+        try:
+            lines = []
+            for index, (request, _) in enumerate(batch, start=1):
+                line = f"{index}. Tool: {request['tool_name']}"
+                if request.get("tool_description"):
+                    line += f"\n   Purpose: {request['tool_description']}"
+                arguments = request.get("tool_arguments") or {}
+                args_preview = ", ".join(
+                    f"{key}: {str(value)[:50]}" for key, value in list(arguments.items())[:5] if value
+                )
+                if args_preview:
+                    line += f"\n   Parameters: {args_preview}"
+                lines.append(line)
+
+            user_query = next(
+                (request.get("user_query") for request, _ in batch if request.get("user_query")), ""
+            )
+            user_prompt = f'The user just asked: "{user_query}"\n\nTools being called:\n' + "\n".join(lines)
+
+            client = _get_client()
+            async with _ANNOUNCE_SEM:
+                response = await client.chat.completions.create(
+                    model=batch[0][0].get("model", "gpt-4o-mini"),
+                    messages=[
+                        {"role": "system", "content": _SYSTEM_PROMPT_BATCH},
+                        {"role": "user", "content": user_prompt},
+                    ],
+                    temperature=batch[0][0].get("temperature", 0.9),
+                    max_tokens=35 * len(batch),
+                    response_format={"type": "json_object"}
+                )
+
+            parsed = json.loads(response.choices[0].message.content or "{}")
+            phrases = parsed.get("phrases")
+            if not isinstance(phrases, list) or len(phrases) != len(batch):
+                raise ValueError(f"Expected {len(batch)} phrases, got {phrases!r}")
+
+            for (_, future), phrase in zip(batch, phrases):
+                if not future.done():
+                    future.set_result(str(phrase).strip().strip('"').strip("'"))
+
+        except Exception as e:
+            logger.warning(f"Error generating batched announcements, falling back to single calls: {e}")
+            # Fall back to independent single-tool generations
+            results = await asyncio.gather(
+                *(generate_tool_announcement(**request) for request, _ in batch),
+                return_exceptions=True
+            )
+            for (_, future), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_result("Let me check that for you.")
+                else:
+                    future.set_result(result)
+
+
+_batcher = _AnnouncementBatcher()
+
+
+async def generate_tool_announcement_batched(
+    user_query: str,
+    tool_name: str,
+    tool_description: str = "",
+    tool_arguments: Optional[Dict[str, Any]] = None,
+    previously_announced: Optional[Set[str]] = None,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.9
+) -> str:
+    """Like generate_tool_announcement, but coalesces concurrent callers.
 
-You're about to call a tool to get their answer.{tool_details}
+    Requests arriving within the batch window (50ms, or sooner once 4
+    queue up) share a single LLM round trip. Use this when several tools
+    fire near-simultaneously; a lone caller behaves exactly like
+    generate_tool_announcement.
+    """
+    return await _batcher.submit({
+        "user_query": user_query,
+        "tool_name": tool_name,
+        "tool_description": tool_description,
+        "tool_arguments": tool_arguments,
+        "previously_announced": previously_announced,
+        "model": model,
+        "temperature": temperature,
+    })
+
+
+async def generate_combined_announcements(
+    user_query: str,
+    tool_name: str,
+    tool_description: str = "",
+    tool_arguments: Optional[Dict[str, Any]] = None,
+    tools_involved: Optional[List[str]] = None,
+    previously_announced: Optional[Set[str]] = None,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.9,
+    max_tokens: int = 90
+) -> Dict[str, str]:
+    """Generate the query-intent and tool announcements in one LLM call.
 
-CRITICAL: If there are specific parameters (like a person's name, date, store name, etc.), MENTION THEM in your response!
-Be SPECIFIC - don't just say "fetching data", say WHAT you're fetching and FOR WHOM/WHAT.
+    When both announcement features fire on the first tool call of a turn,
+    two sequential LLM calls each pay their own round-trip and TTFT. This
+    helper asks for both phrases in a single JSON response instead.
 
-Generate a brief, natural phrase (6-12 words max) that:
-1. Mentions any specific names, dates, or identifiers from the parameters
-2. Connects to what the user asked for
-3. Sounds like casual speech, not a technical description{avoid_phrases}
+    Args:
+        user_query: The user's original question
+        tool_name: Name of the first tool being called
+        tool_description: Description of what the tool does
+        tool_arguments: Arguments being passed to the tool
+        tools_involved: List of tool names that will be called
+        previously_announced: Phrases already announced (to avoid repetition)
+        model: LLM model to use (default: gpt-4o-mini)
+        temperature: LLM temperature (default: 0.9 for variety)
+        max_tokens: Maximum tokens to generate (default: 90)
 
-Good examples (notice the specifics):
-- "I'm looking up Jerry Lewis's transaction details"
-- "OK, now I'm checking Barry White's sales numbers now"
-- "Thanks for your patience. Now I'm getting the data for Tony Goldsmith"
-- "OK, now I'm looking up last week's numbers for the London store"
-- "Nearly there! Just pulling up Sarah's performance metrics"
+    Returns:
+        Dict with "intent" (opening statement) and "tool" (tool announcement)
+    """
+    if tool_arguments is None:
+        tool_arguments = {}
+    if tools_involved is None:
+        tools_involved = []
 
-Bad examples (too generic):
-- "Fetching that data for you"
-- "Retrieving the information"
-- "Getting those details"
+    try:
+        tools_text = ""
+        if tools_involved:
+            tools_text = f"\nYou'll be using these tools: {', '.join(tools_involved[:3])}"
+
+        tool_details = f"\nFirst tool being called: {tool_name}"
+        if tool_description:
+            tool_details += f"\n- Purpose: {tool_description}"
+        if tool_arguments:
+            args_preview = ", ".join(
+                f"{key}: {str(value)[:50]}" for key, value in list(tool_arguments.items())[:5] if value
+            )
+            if args_preview:
+                tool_details += f"\n- Parameters: {args_preview}"
+
+        avoid_phrases = ""
+        if previously_announced:
+            avoid_phrases = "\n\nYou've already said these phrases, so say something DIFFERENT:\n" + "\n".join(
+                f"- {phrase}" for phrase in previously_announced
+            )
+
+        prompt = f"""You are a helpful voice assistant. The user just asked: "{user_query}"{tools_text}{tool_details}
 
-Your response (just the phrase, nothing else):"""
+You're about to work through this request. Generate TWO phrases as JSON:
+1. "intent": a brief, confident opening statement (12-15 words) like "OK, I'm going to work through projecting the sales performance for you"
+2. "tool": a brief, natural phrase (6-12 words) describing the first tool call, mentioning any specific names, dates, or identifiers from the parameters{avoid_phrases}
+
+Respond with ONLY a JSON object like: {{"intent": "...", "tool": "..."}}"""
 
         # Use OpenAI to generate the response
-        from openai import AsyncOpenAI
-        client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        client = _get_client()
 
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        async with _ANNOUNCE_SEM:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"}
+            )
 
         result = response.choices[0].message.content
         if result:
-            result = result.strip()
-            # Remove quotes if the LLM added them
-            result = result.strip('"').strip("'")
-            return result
-        else:
-            return "Let me check that for you."
+            parsed = json.loads(result)
+            return {
+                "intent": str(parsed.get("intent") or "OK, let me work on that for you."),
+                "tool": str(parsed.get("tool") or "Let me check that for you."),
+            }
+
+        return {
+            "intent": "OK, let me work on that for you.",
+            "tool": "Let me check that for you.",
+        }
 
     except Exception as e:
-        logger.warning(f"Error generating tool announcement: {e}")
-        return "Let me check that for you."
+        logger.warning(f"Error generating combined announcements: {e}")
+        return {
+            "intent": "OK, let me work on that for you.",
+            "tool": "Let me check that for you.",
+        }
 
 
 async def generate_progress_announcement(
     progress_message: Union[str, List[str]],
     previously_announced: Optional[List[str]] = None,
     raw_messages: Optional[List[str]] = None,
-    model: str = "gpt-4o",
+    model: str = "gpt-4o-mini",
     temperature: float = 0.9,
     max_tokens: int = 20
 ) -> str:
@@ -160,7 +688,7 @@ async def generate_progress_announcement(
         progress_message: Single raw message or list of batched messages from the MCP tool
         previously_announced: List of natural phrases already announced (to build narrative flow)
         raw_messages: List of raw progress messages received (to see what's actually changing)
-        model: LLM model to use (default: gpt-4o)
+        model: LLM model to use (default: gpt-4o-mini)
         temperature: LLM temperature (default: 0.9 for variety)
         max_tokens: Maximum tokens to generate (default: 20)
 
@@ -179,65 +707,34 @@ async def generate_progress_announcement(
         messages = progress_message
 
     try:
-        # Build context of conversation flow
-        context = ""
-        if previously_announced and len(previously_announced) > 0:
-            recent = previously_announced[-3:]  # Last 3 messages for context
-            context = "\n\nYou've already said to the user:\n" + "\n".join([f"- \"{msg}\"" for msg in recent])
-            context += "\n\nIMPORTANT: Say something DIFFERENT this time. Build on the narrative, don't repeat."
-
-        # Add info about what's actually changing in the raw messages
-        if raw_messages and len(raw_messages) > 1:
-            recent_raw = raw_messages[-3:]
-            context += f"\n\nRecent progress updates from the system:\n" + "\n".join([f"- {msg}" for msg in recent_raw])
-            context += f"\n\nNotice what's DIFFERENT in the latest update and reflect that change."
-
-        # Format the messages for the prompt
-        if len(messages) == 1:
-            system_message = f'System message: "{messages[0]}"'
-        else:
-            system_message = f"System sent {len(messages)} quick updates:\n" + "\n".join([f'- "{msg}"' for msg in messages])
-            system_message += f"\n\nSummarize what's happening overall (don't list each step)."
-
-        prompt = f"""You're helping someone and giving them quick casual updates while you work.
-
-{system_message}{context}
-
-Turn this into a super casual, natural spoken update (3-6 words max).
-Talk like you're thinking out loud while working, NOT like you're reading a procedure manual.
-Be LAZY with words - just mention the overall progress, don't narrate every step.
+        # Check the response cache before paying for an LLM round trip
+        cache_key = None
+        if not _announcement_cache.cache_bypassed(temperature):
+            cache_key = _announcement_cache.make_progress_key(messages, model, temperature)
+            cached = await _announcement_cache.get_cached(cache_key)
+            if cached is not None and cached not in previously_announced:
+                return cached
 
-DO (casual, minimal):
-- "Got it"
-- "Hmm, lots of rows"
-- "Okay, comparing now"
-- "Almost there"
-- "Just checking something"
-
-DON'T (too formal/procedural):
-- "Gathering all sales records"
-- "Calculating the total sales figure"
-- "Finalizing the analysis"
-- "Diving into the details"
-- "Let's break down these rows"
-
-Just say what you're actually seeing/doing right now (3-6 words):"""
+        chat_messages = _build_progress_messages(messages, previously_announced, raw_messages)
 
         # Use OpenAI to generate the response
-        from openai import AsyncOpenAI
-        client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        client = _get_client()
 
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        async with _ANNOUNCE_SEM:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=chat_messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                extra_body={"prompt_cache_key": "announce-progress"}
+            )
 
         result = response.choices[0].message.content
         if result:
             result = result.strip()
             result = result.strip('"').strip("'")
+            if cache_key is not None:
+                await _announcement_cache.put_cached(cache_key, result)
             return result
         else:
             return "Still working on that."
@@ -247,10 +744,46 @@ Just say what you're actually seeing/doing right now (3-6 words):"""
         return "Still working on that."
 
 
+def _build_progress_messages(
+    messages: List[str],
+    previously_announced: List[str],
+    raw_messages: List[str]
+) -> List[Dict[str, str]]:
+    """Build the chat messages for a progress announcement.
+
+    Static instructions go in the system message (cacheable prefix); the
+    batched progress text and recent-history context go in the user message.
+    """
+    # Build context of conversation flow
+    context = ""
+    if previously_announced and len(previously_announced) > 0:
+        recent = list(previously_announced)[-3:]  # Last 3 messages for context
+        context = "\n\nYou've already said to the user:\n" + "\n".join([f"- \"{msg}\"" for msg in recent])
+        context += "\n\nIMPORTANT: Say something DIFFERENT this time. Build on the narrative, don't repeat."
+
+    # Add info about what's actually changing in the raw messages
+    if raw_messages and len(raw_messages) > 1:
+        recent_raw = list(raw_messages)[-3:]
+        context += "\n\nRecent progress updates from the system:\n" + "\n".join([f"- {msg}" for msg in recent_raw])
+        context += "\n\nNotice what's DIFFERENT in the latest update and reflect that change."
+
+    # Format the messages for the prompt
+    if len(messages) == 1:
+        system_message = f'System message: "{messages[0]}"'
+    else:
+        system_message = f"System sent {len(messages)} quick updates:\n" + "\n".join([f'- "{msg}"' for msg in messages])
+        system_message += "\n\nSummarize what's happening overall (don't list each step)."
+
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT_PROGRESS},
+        {"role": "user", "content": f"{system_message}{context}"},
+    ]
+
+
 async def generate_query_intent_announcement(
     user_query: str,
     tools_involved: List[str],
-    model: str = "gpt-4o",
+    model: str = "gpt-4o-mini",
     temperature: float = 0.8,
     max_tokens: int = 40
 ) -> str:
@@ -262,7 +795,7 @@ async def generate_query_intent_announcement(
     Args:
         user_query: The user's original question
         tools_involved: List of tool names that will be called
-        model: LLM model to use (default: gpt-4o)
+        model: LLM model to use (default: gpt-4o-mini)
         temperature: LLM temperature (default: 0.8)
         max_tokens: Maximum tokens to generate (default: 40)
 
@@ -273,44 +806,35 @@ async def generate_query_intent_announcement(
         - "OK, I'm going to work through projecting the sales performance for you"
         - "Let me analyze the year-over-year trends across all stores"
         - "I'll compare this year's performance to last year's numbers"
-    """
-    try:
-        # Format tool names in a readable way
-        tools_text = ""
-        if tools_involved:
-            tools_text = f"\n\nYou'll be using these tools: {', '.join(tools_involved[:3])}"  # Limit to 3
-
-        prompt = f"""You are a helpful voice assistant. The user just asked: "{user_query}"{tools_text}
-
-You're about to work through this request to help answer their question.
-
-Generate a brief, natural opening statement (12-15 words) that:
-1. Acknowledges what you're about to do
-2. Sounds confident and helpful
-3. Uses phrases like "OK, I'm going to...", "Let me...", "I'll...", "Alright, I'll..."
-4. Mentions the key task in a natural way
 
-Be specific about what you'll do, but keep it conversational and friendly.
+    Note:
+        This call costs an OpenAI round trip (~200-500ms), so don't await it
+        serially before starting the real work. Launch it as a task and
+        overlap it with MCP initialization or the tool call itself::
 
-Examples:
-- "OK, I'm going to work through projecting the sales performance for you"
-- "Let me analyze the year-over-year trends across all stores"
-- "Alright, I'll compare this year's numbers to last year"
-- "OK, let me pull together those sales figures for you"
-- "I'll work through the store rankings based on that data"
+            intent_task = asyncio.create_task(
+                generate_query_intent_announcement(query, tools)
+            )
+            init_task = asyncio.create_task(server.initialize())
+            intent, _ = await asyncio.gather(intent_task, init_task)
 
-Your response (just the opening statement, nothing else):"""
+        The agent in agent.py already applies this pattern, firing the
+        announcement in the background while the tool call proceeds.
+    """
+    try:
+        messages = _build_intent_prompt(user_query, tools_involved)
 
         # Use OpenAI to generate the response
-        from openai import AsyncOpenAI
-        client = AsyncOpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
+        client = _get_client()
 
-        response = await client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=temperature,
-            max_tokens=max_tokens
-        )
+        async with _ANNOUNCE_SEM:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                extra_body={"prompt_cache_key": "announce-intent"}
+            )
 
         result = response.choices[0].message.content
         if result:
@@ -324,3 +848,60 @@ Your response (just the opening statement, nothing else):"""
     except Exception as e:
         logger.warning(f"Error generating query intent announcement: {e}")
         return "OK, let me work on that for you."
+
+
+async def generate_query_intent_announcement_stream(
+    user_query: str,
+    tools_involved: List[str],
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.8,
+    max_tokens: int = 40
+) -> AsyncIterator[str]:
+    """Stream the query-intent announcement sentence by sentence.
+
+    Same prompt as generate_query_intent_announcement, but yields each
+    sentence as soon as its boundary appears in the token stream so TTS
+    can begin speaking before the LLM finishes generating.
+    """
+    try:
+        messages = _build_intent_prompt(user_query, tools_involved)
+
+        client = _get_client()
+
+        async with _ANNOUNCE_SEM:
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=True,
+                extra_body={"prompt_cache_key": "announce-intent"}
+            )
+
+        spoke = False
+        async for sentence in _stream_sentences(stream):
+            spoke = True
+            yield sentence
+        if not spoke:
+            yield "OK, let me work on that for you."
+
+    except Exception as e:
+        logger.warning(f"Error streaming query intent announcement: {e}")
+        yield "OK, let me work on that for you."
+
+
+def _build_intent_prompt(user_query: str, tools_involved: List[str]) -> List[Dict[str, str]]:
+    """Build the chat messages for a query-intent announcement.
+
+    The instruction block is a static system message so repeated calls share
+    a cacheable prompt prefix; only the query and tool list vary.
+    """
+    # Format tool names in a readable way
+    tools_text = ""
+    if tools_involved:
+        tools_text = f"\n\nYou'll be using these tools: {', '.join(tools_involved[:3])}"  # Limit to 3
+
+    return [
+        {"role": "system", "content": _SYSTEM_PROMPT_INTENT},
+        {"role": "user", "content": f'The user just asked: "{user_query}"{tools_text}'},
+    ]
@@ -1,14 +1,40 @@
 """Progress queue management for long-running MCP operations."""
 
 import asyncio
+import re
 import time
 import logging
-from collections import deque
-from typing import Callable, Optional, Dict, Set, List
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Optional, Dict, Set, List
 from .announcements import generate_progress_announcement
 
 logger = logging.getLogger(__name__)
 
+# Hard cap on the dedup map so a pathological message stream can't grow it
+# without bound
+_MAX_ANNOUNCED_ENTRIES = 1024
+
+# Per-tool history depth; announcements only ever look at the last few
+# entries, so older ones are dropped instead of kept for the tool's lifetime
+_MAX_HISTORY_ENTRIES = 16
+
+# Very granular/technical progress messages that would be too chatty to
+# announce. Joined into one alternation so _should_announce does a single
+# compiled scan instead of ten Python-level substring checks per message.
+_SKIP_PATTERNS = (
+    "selecting",
+    "identifying",
+    "gathering all",
+    "calculating the total",
+    "finalizing the",
+    "compiling the final",
+    "diving into",
+    "let's break down",
+    "exploring new patterns",
+    "ready to save",
+)
+_SKIP_RE = re.compile("|".join(map(re.escape, _SKIP_PATTERNS)), re.IGNORECASE)
+
 
 class ProgressManager:
     """Manages progress announcements for MCP tools.
@@ -26,7 +52,7 @@ class ProgressManager:
         speak_callback: Callable[[str], None],
         enable_natural_language: bool = True,
         dedup_window_seconds: float = 3.0,
-        model: str = "gpt-4o",
+        model: str = "gpt-4o-mini",
         temperature: float = 0.9,
         batch_window_seconds: float = 5.0
     ):
@@ -36,7 +62,7 @@ class ProgressManager:
             speak_callback: Callback to speak text to the user
             enable_natural_language: If True, rephrase progress with LLM
             dedup_window_seconds: Don't repeat same message within this window
-            model: LLM model to use for generating announcements (default: gpt-4o)
+            model: LLM model to use for generating announcements (default: gpt-4o-mini)
             temperature: Temperature for LLM generation (default: 0.9)
             batch_window_seconds: Wait this long to batch multiple progress messages (default: 5.0)
         """
@@ -47,105 +73,157 @@ class ProgressManager:
         self.temperature = temperature
         self.batch_window_seconds = batch_window_seconds
 
-        # Track announced messages to avoid duplicates
-        self.announced_progress: Dict[str, float] = {}  # message -> timestamp
+        # Track announced messages to avoid duplicates. Kept in insertion
+        # order so stale entries can be popped from the front in O(1)
+        self.announced_progress: "OrderedDict[str, float]" = OrderedDict()  # message -> timestamp
 
-        # Track announcement history per tool for narrative flow
-        self.announcement_history: Dict[str, List[str]] = {}  # Natural language announcements
-        self.raw_message_history: Dict[str, List[str]] = {}   # Raw progress messages
+        # Track announcement history per tool for narrative flow, bounded
+        # so long-running tools don't accumulate every message they emit
+        self.announcement_history: Dict[str, Deque[str]] = {}  # Natural language announcements
+        self.raw_message_history: Dict[str, Deque[str]] = {}   # Raw progress messages
 
         # Progress queues per tool
-        self.progress_queues: Dict[str, deque] = {}
+        self.progress_queues: Dict[str, asyncio.Queue] = {}
         self.active_speakers: Dict[str, asyncio.Task] = {}
-        self.speaker_stop_flags: Dict[str, bool] = {}
+        self.stop_events: Dict[str, asyncio.Event] = {}
+
+    async def _collect_batch(self, tool_name: str, queue: asyncio.Queue, stop_event: asyncio.Event) -> Optional[List[str]]:
+        """Wait for the next batch of progress messages for a tool.
+
+        Blocks until a message arrives or the tool completes, then waits
+        batch_window_seconds to collect any follow-up messages.
+
+        Returns:
+            The batched messages, or None if the tool completed first
+        """
+        # Block until a message arrives or the tool completes; no
+        # polling, and the first message is picked up immediately
+        get_task = asyncio.ensure_future(queue.get())
+        stop_task = asyncio.ensure_future(stop_event.wait())
+        done, pending = await asyncio.wait(
+            {get_task, stop_task},
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+
+        if get_task not in done:
+            return None
+
+        # Collect the first message
+        batched_messages = [get_task.result()]
+
+        # Wait for the batch window to collect more messages - unless a
+        # full batch is already queued (no point delaying the update), and
+        # waking immediately if the tool completes mid-window
+        if queue.qsize() < 4:
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.batch_window_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+        # Collect any additional messages that arrived during the wait
+        while len(batched_messages) < 5:  # Limit to 5 messages per batch
+            try:
+                batched_messages.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+
+        return batched_messages
+
+    async def _announce_batch(self, tool_name: str, batched_messages: List[str]) -> str:
+        """Turn a batch of progress messages into the phrase to speak."""
+        if self.enable_natural_language:
+            try:
+                # Get conversation history for this tool
+                natural_history = self.announcement_history.setdefault(
+                    tool_name, deque(maxlen=_MAX_HISTORY_ENTRIES)
+                )
+                raw_history = self.raw_message_history.setdefault(
+                    tool_name, deque(maxlen=_MAX_HISTORY_ENTRIES)
+                )
+
+                # Track all the raw messages
+                raw_history.extend(batched_messages)
+
+                # Generate announcement from batched messages
+                natural_message = await generate_progress_announcement(
+                    batched_messages,  # Pass list of messages
+                    previously_announced=natural_history,
+                    raw_messages=raw_history,
+                    model=self.model,
+                    temperature=self.temperature
+                )
+                logger.info(f"Speaking batched progress for {tool_name}: {natural_message} (from {len(batched_messages)} messages)")
+
+                # Track what we've said for narrative flow
+                natural_history.append(natural_message)
+                return natural_message
+
+            except Exception as e:
+                logger.warning(f"Error generating natural progress message: {e}")
+                return batched_messages[-1]  # Fall back to last message
+        else:
+            # Without natural language, just use the last message
+            natural_message = batched_messages[-1]
+            logger.info(f"Speaking progress for {tool_name}: {natural_message}")
+            return natural_message
 
     async def _speak_progress_queue(self, tool_name: str):
         """Asynchronously speak queued progress messages for a tool.
 
         Batches messages that arrive within batch_window_seconds to avoid being too chatty.
-        Stops immediately if the tool completes (indicated by stop flag).
+        Stops immediately if the tool completes (indicated by the stop event).
+
+        Batches are pipelined: while one batch's announcement is being
+        generated and spoken, collection of the next batch is already under
+        way, so the LLM round trip overlaps the next batch window instead of
+        delaying it.
         """
+        queue = self.progress_queues[tool_name]
+        stop_event = self.stop_events[tool_name]
+        next_collect: Optional[asyncio.Task] = None
         try:
-            while True:
-                # Check if tool has completed
-                if self.speaker_stop_flags.get(tool_name, False):
-                    logger.info(f"Tool {tool_name} completed, stopping progress announcements")
+            batched_messages = await self._collect_batch(tool_name, queue, stop_event)
+            while batched_messages is not None and not stop_event.is_set():
+                # Start collecting the next batch before the (potentially
+                # slow) LLM call for this one
+                next_collect = asyncio.ensure_future(
+                    self._collect_batch(tool_name, queue, stop_event)
+                )
+
+                natural_message = await self._announce_batch(tool_name, batched_messages)
+
+                # Check again if tool completed while we were generating
+                if stop_event.is_set():
+                    logger.info(f"Tool {tool_name} completed during batch window, stopping")
                     break
 
-                # Check if there are messages to speak
-                if tool_name in self.progress_queues and len(self.progress_queues[tool_name]) > 0:
-                    # Collect the first message
-                    batched_messages = [self.progress_queues[tool_name].popleft()]
-
-                    # Wait for the batch window to collect more messages
-                    await asyncio.sleep(self.batch_window_seconds)
-
-                    # Collect any additional messages that arrived during the wait
-                    while (tool_name in self.progress_queues and
-                           len(self.progress_queues[tool_name]) > 0 and
-                           len(batched_messages) < 5):  # Limit to 5 messages per batch
-                        batched_messages.append(self.progress_queues[tool_name].popleft())
-
-                    # Check again if tool completed while we were waiting
-                    if self.speaker_stop_flags.get(tool_name, False):
-                        logger.info(f"Tool {tool_name} completed during batch window, stopping")
-                        break
-
-                    # Generate a single announcement from the batched messages
-                    if self.enable_natural_language:
-                        try:
-                            # Get conversation history for this tool
-                            natural_history = self.announcement_history.get(tool_name, [])
-                            raw_history = self.raw_message_history.get(tool_name, [])
-
-                            # Track all the raw messages
-                            if tool_name not in self.raw_message_history:
-                                self.raw_message_history[tool_name] = []
-                            self.raw_message_history[tool_name].extend(batched_messages)
-
-                            # Generate announcement from batched messages
-                            natural_message = await generate_progress_announcement(
-                                batched_messages,  # Pass list of messages
-                                previously_announced=natural_history,
-                                raw_messages=raw_history,
-                                model=self.model,
-                                temperature=self.temperature
-                            )
-                            logger.info(f"Speaking batched progress for {tool_name}: {natural_message} (from {len(batched_messages)} messages)")
-
-                            # Track what we've said for narrative flow
-                            if tool_name not in self.announcement_history:
-                                self.announcement_history[tool_name] = []
-                            self.announcement_history[tool_name].append(natural_message)
-
-                        except Exception as e:
-                            logger.warning(f"Error generating natural progress message: {e}")
-                            natural_message = batched_messages[-1]  # Fall back to last message
-                    else:
-                        # Without natural language, just use the last message
-                        natural_message = batched_messages[-1]
-                        logger.info(f"Speaking progress for {tool_name}: {natural_message}")
-
-                    # Speak the message
-                    self.speak_callback(natural_message)
-
-                    # Small delay to avoid overwhelming the TTS
-                    await asyncio.sleep(0.1)
-                else:
-                    # No messages, wait a bit and check again
-                    await asyncio.sleep(0.1)
+                # Speak the message (non-blocking; TTS plays out asynchronously)
+                self.speak_callback(natural_message)
+
+                # Small delay to avoid overwhelming the TTS
+                await asyncio.sleep(0.1)
+
+                batched_messages = await next_collect
+                next_collect = None
+
+            if batched_messages is None:
+                logger.info(f"Tool {tool_name} completed, stopping progress announcements")
 
         except Exception as e:
             logger.warning(f"Error speaking progress for {tool_name}: {e}")
         finally:
+            if next_collect is not None and not next_collect.done():
+                next_collect.cancel()
             # Clean up when done
             if tool_name in self.progress_queues:
-                remaining = len(self.progress_queues[tool_name])
+                remaining = self.progress_queues[tool_name].qsize()
                 if remaining > 0:
                     logger.info(f"Cleared {remaining} unspoken progress messages for {tool_name}")
                 del self.progress_queues[tool_name]
-            if tool_name in self.speaker_stop_flags:
-                del self.speaker_stop_flags[tool_name]
+            if tool_name in self.stop_events:
+                del self.stop_events[tool_name]
             if tool_name in self.active_speakers:
                 del self.active_speakers[tool_name]
             if tool_name in self.announcement_history:
@@ -158,27 +236,7 @@ class ProgressManager:
 
         Filters out very granular/technical progress that would be too chatty.
         """
-        message_lower = message.lower()
-
-        # Skip very technical/granular messages
-        skip_patterns = [
-            "selecting",
-            "identifying",
-            "gathering all",
-            "calculating the total",
-            "finalizing the",
-            "compiling the final",
-            "diving into",
-            "let's break down",
-            "exploring new patterns",
-            "ready to save",
-        ]
-
-        for pattern in skip_patterns:
-            if pattern in message_lower:
-                return False
-
-        return True
+        return _SKIP_RE.search(message) is None
 
     def queue_progress(self, tool_name: str, message: str):
         """Queue a progress message for a tool.
@@ -200,23 +258,26 @@ class ProgressManager:
             if last_announced is None or (now - last_announced) > self.dedup_window_seconds:
                 # Initialize queue if needed
                 if tool_name not in self.progress_queues:
-                    self.progress_queues[tool_name] = deque()
-                    self.speaker_stop_flags[tool_name] = False
+                    self.progress_queues[tool_name] = asyncio.Queue()
+                    self.stop_events[tool_name] = asyncio.Event()
 
                     # Start the speaker task for this tool
                     task = asyncio.create_task(self._speak_progress_queue(tool_name))
                     self.active_speakers[tool_name] = task
 
-                # Queue the message
-                self.progress_queues[tool_name].append(message)
+                # Queue the message (wakes the speaker immediately)
+                self.progress_queues[tool_name].put_nowait(message)
                 self.announced_progress[message] = now
+                self.announced_progress.move_to_end(message)
                 logger.debug(f"Queued progress for {tool_name}: {message}")
 
-                # Clean up old entries to prevent memory leak
+                # Pop stale entries from the front (oldest-first order makes
+                # this amortized O(1) instead of a full scan per message)
                 cutoff_time = now - (self.dedup_window_seconds * 2)
-                to_remove = [msg for msg, ts in self.announced_progress.items() if ts < cutoff_time]
-                for msg in to_remove:
-                    del self.announced_progress[msg]
+                while self.announced_progress and next(iter(self.announced_progress.values())) < cutoff_time:
+                    self.announced_progress.popitem(last=False)
+                while len(self.announced_progress) > _MAX_ANNOUNCED_ENTRIES:
+                    self.announced_progress.popitem(last=False)
             else:
                 # Skip duplicate within dedup window
                 logger.debug(f"Skipped duplicate progress for {tool_name}: {message}")
@@ -231,8 +292,8 @@ class ProgressManager:
             tool_name: Name of the tool that completed
         """
         try:
-            logger.info(f"Tool {tool_name} completed, setting stop flag")
-            self.speaker_stop_flags[tool_name] = True
+            logger.info(f"Tool {tool_name} completed, signalling stop")
+            self.stop_events.setdefault(tool_name, asyncio.Event()).set()
         except Exception as e:
             logger.warning(f"Error in completion callback for {tool_name}: {e}")
 
@@ -244,7 +305,7 @@ class ProgressManager:
                 task.cancel()
 
         self.progress_queues.clear()
-        self.speaker_stop_flags.clear()
+        self.stop_events.clear()
         self.active_speakers.clear()
         self.announced_progress.clear()
         self.announcement_history.clear()
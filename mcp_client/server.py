@@ -1,19 +1,65 @@
 """MCP server connection handlers supporting SSE, stdio, and HTTP."""
 
 import os
+import inspect
+import functools
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, Callable, Literal, Optional
 from livekit.agents.llm.mcp import MCPServer, MCPServerHTTP, MCPServerStdio
 
 
 TransportType = Literal["sse", "streamable_http", "stdio"]
 
+# Transports served over HTTP, prebuilt as a frozenset so the membership
+# test in create_mcp_server is a single hash probe
+_HTTP_TRANSPORTS: frozenset = frozenset(("sse", "streamable_http"))
 
-@dataclass
+# URL path suffixes expected by MCPServerHTTP's transport auto-detection
+_SSE_SUFFIX = "/sse"
+_MCP_SUFFIX = "/mcp"
+
+# Keyword accepted by MCPServerHTTP for injecting an httpx client, if any.
+# Resolved once at import so we can share a connection pool across tool calls
+# when the installed livekit-agents version supports it.
+_HTTP_CLIENT_KWARG: Optional[str] = None
+for _param in ("httpx_client", "http_client", "client"):
+    if _param in inspect.signature(MCPServerHTTP.__init__).parameters:
+        _HTTP_CLIENT_KWARG = _param
+        break
+
+_shared_http_client = None
+
+
+def _get_shared_http_client(config: "MCPServerConfig"):
+    """Return a process-wide httpx.AsyncClient with explicit pool limits.
+
+    Reusing one client across MCP servers avoids per-call TCP/TLS handshakes
+    and connection exhaustion under concurrency; default httpx limits are too
+    small for busy agents.
+    """
+    global _shared_http_client
+    if _shared_http_client is None:
+        import httpx
+        _shared_http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(config.sse_read_timeout),
+        )
+    return _shared_http_client
+
+
+@dataclass(slots=True, frozen=True)
 class MCPServerConfig:
     """Configuration for an MCP server connection.
 
+    Slotted and frozen: instances carry no per-instance __dict__ (smaller
+    and faster attribute access) and are immutable once built, so they can
+    safely be shared or used as cache keys.
+
     Attributes:
         transport: Type of transport ("sse", "streamable_http", or "stdio")
         url: Server URL (for SSE and HTTP transports)
@@ -23,6 +69,8 @@ class MCPServerConfig:
         cwd: Working directory (for stdio transport)
         headers: HTTP headers (for HTTP transports)
         timeout: Connection timeout in seconds
+        max_connections: Connection pool size for HTTP transports
+        max_keepalive_connections: Keep-alive connections retained in the pool
         sse_read_timeout: SSE read timeout in seconds
         client_session_timeout: Client session timeout in seconds
 
@@ -36,6 +84,8 @@ class MCPServerConfig:
     headers: dict[str, str] | None = None
     timeout: float = 5.0
     sse_read_timeout: float = 300.0
+    max_connections: int = 500
+    max_keepalive_connections: int = 100
 
     # Stdio parameters
     command: str | None = None
@@ -48,19 +98,132 @@ class MCPServerConfig:
 
     def validate(self) -> None:
         """Validate the configuration."""
-        if self.transport in ("sse", "streamable_http"):
-            if not self.url:
-                raise ValueError(f"URL is required for {self.transport} transport")
-        elif self.transport == "stdio":
-            if not self.command:
-                raise ValueError("Command is required for stdio transport")
-        else:
-            raise ValueError(f"Invalid transport type: {self.transport}")
+        try:
+            _VALIDATORS[self.transport](self)
+        except KeyError:
+            raise ValueError(f"Invalid transport type: {self.transport}") from None
+
+
+def _require_url(config: MCPServerConfig) -> None:
+    if not config.url:
+        raise ValueError(f"URL is required for {config.transport} transport")
+
+
+def _require_command(config: MCPServerConfig) -> None:
+    if not config.command:
+        raise ValueError("Command is required for stdio transport")
+
+
+# Per-transport validation dispatch: one dict probe instead of an if/elif
+# chain of string comparisons per validate() call
+_VALIDATORS: dict[str, Callable[[MCPServerConfig], None]] = {
+    "sse": _require_url,
+    "streamable_http": _require_url,
+    "stdio": _require_command,
+}
+
+
+# Already-constructed servers keyed by connection identity, with refcounts
+# so an instance shared by several wrappers is only closed once the last
+# holder releases it. Reusing a server skips the MCP initialize handshake
+# (several HTTP round trips) for every wrapper after the first.
+_SERVER_POOL: dict = {}       # pool key -> [server, refcount]
+_POOL_KEYS: dict = {}         # id(server) -> pool key
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_http_url(url: str, transport: str) -> str:
+    """Ensure the URL path carries the suffix expected by the transport.
+
+    Pure function of its arguments, so reconnect loops and health-check
+    restarts hitting the same URL resolve from the LRU cache instead of
+    redoing the string work.
+    """
+    # Don't modify URLs that already have the correct suffix. Plain
+    # string ops suffice here; a full urlparse/urlunparse round trip
+    # is only needed for exotic "#...?..." orderings
+    fragment_pos = url.find("#")
+    query_pos = url.find("?")
+    if fragment_pos != -1 and query_pos > fragment_pos:
+        from urllib.parse import urlparse, urlunparse
+        parsed = urlparse(url)
+        path = parsed.path.rstrip("/")
+        if transport == "sse" and not path.endswith(_SSE_SUFFIX):
+            parsed = parsed._replace(path=path + _SSE_SUFFIX)
+        elif transport == "streamable_http" and not path.endswith(_MCP_SUFFIX):
+            parsed = parsed._replace(path=path + _MCP_SUFFIX)
+        return urlunparse(parsed)
+
+    # Split off the query/fragment tail, fix the path, reattach
+    cut = len(url)
+    if query_pos != -1:
+        cut = query_pos
+    if fragment_pos != -1 and fragment_pos < cut:
+        cut = fragment_pos
+    base, tail = url[:cut].rstrip("/"), url[cut:]
+    if transport == "sse" and not base.endswith(_SSE_SUFFIX):
+        return base + _SSE_SUFFIX + tail
+    if transport == "streamable_http" and not base.endswith(_MCP_SUFFIX):
+        return base + _MCP_SUFFIX + tail
+    # Suffix already present: hand back the URL exactly as given (including
+    # any trailing slash — some servers treat /mcp and /mcp/ differently)
+    return url
+
+
+def _pool_key(config: MCPServerConfig):
+    """Identity of the connection a config describes."""
+    if config.transport in _HTTP_TRANSPORTS:
+        headers = tuple(sorted(config.headers.items())) if config.headers else None
+        return (config.transport, config.url, headers)
+    env = tuple(sorted(config.env.items())) if config.env else None
+    return (
+        "stdio",
+        config.command,
+        tuple(config.args) if config.args else (),
+        env,
+        str(config.cwd) if config.cwd else None,
+    )
+
+
+async def release_mcp_server(server: MCPServer) -> None:
+    """Release a server obtained from create_mcp_server.
+
+    Pool-owned servers are only closed when their last holder releases
+    them; servers unknown to the pool are closed directly.
+    """
+    key = _POOL_KEYS.get(id(server))
+    entry = _SERVER_POOL.get(key) if key is not None else None
+    if entry is None or entry[0] is not server:
+        await server.aclose()
+        return
+
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _SERVER_POOL[key]
+        del _POOL_KEYS[id(server)]
+        await server.aclose()
+
+
+async def close_mcp_server_pool() -> None:
+    """Close every pooled server regardless of refcount (call at shutdown)."""
+    servers = [entry[0] for entry in _SERVER_POOL.values()]
+    _SERVER_POOL.clear()
+    _POOL_KEYS.clear()
+    for server in servers:
+        try:
+            await server.aclose()
+        except Exception:
+            pass
 
 
 def create_mcp_server(config: MCPServerConfig) -> MCPServer:
     """Create an MCP server instance from configuration.
 
+    Configs describing the same connection (same URL and headers, or same
+    command line) share one pooled, refcounted instance, so repeat setups
+    skip the initialize handshake. Pair each call with
+    release_mcp_server() rather than closing the server directly.
+
     Args:
         config: Server configuration
 
@@ -98,32 +261,41 @@ def create_mcp_server(config: MCPServerConfig) -> MCPServer:
     """
     config.validate()
 
-    if config.transport in ("sse", "streamable_http"):
+    key = _pool_key(config)
+    entry = _SERVER_POOL.get(key)
+    if entry is not None:
+        entry[1] += 1
+        return entry[0]
+
+    server = _construct_server(config)
+    _SERVER_POOL[key] = [server, 1]
+    _POOL_KEYS[id(server)] = key
+    return server
+
+
+def _construct_server(config: MCPServerConfig) -> MCPServer:
+    """Build a fresh server instance for a validated config."""
+    if config.transport in _HTTP_TRANSPORTS:
         # For HTTP transports, the MCPServerHTTP class auto-detects
         # the transport type based on the URL path
-        url = config.url
-        assert url is not None
+        assert config.url is not None
 
         # Ensure URL path ends with correct suffix for transport type
-        # Don't modify URLs that already have the correct suffix
-        from urllib.parse import urlparse, urlunparse
-        parsed = urlparse(url)
-        path = parsed.path.rstrip("/")
-
-        if config.transport == "sse" and not path.endswith("/sse"):
-            parsed = parsed._replace(path=path + "/sse")
-        elif config.transport == "streamable_http" and not path.endswith("/mcp"):
-            parsed = parsed._replace(path=path + "/mcp")
+        url = _normalize_http_url(config.url, config.transport)
 
-        url = urlunparse(parsed)
-
-        return MCPServerHTTP(
+        kwargs: dict[str, Any] = dict(
             url=url,
             headers=config.headers,
             timeout=config.timeout,
             sse_read_timeout=config.sse_read_timeout,
             client_session_timeout_seconds=config.client_session_timeout,
         )
+        # Share a pooled keep-alive client across servers when the installed
+        # livekit-agents version allows injecting one
+        if _HTTP_CLIENT_KWARG is not None:
+            kwargs[_HTTP_CLIENT_KWARG] = _get_shared_http_client(config)
+
+        return MCPServerHTTP(**kwargs)
 
     elif config.transport == "stdio":
         command = config.command
@@ -141,6 +313,25 @@ def create_mcp_server(config: MCPServerConfig) -> MCPServer:
         raise ValueError(f"Unsupported transport type: {config.transport}")
 
 
+@functools.lru_cache(maxsize=32)
+def _resolve_env_url(url_env_var: str) -> str:
+    """Resolve a server URL env var once per process.
+
+    Environment variables don't change mid-process in typical agent
+    deployments, so repeated lookups (and their string allocations) are
+    wasted work.
+    """
+    url = os.environ.get(url_env_var)
+    if not url:
+        raise ValueError(f"Environment variable {url_env_var} is not set")
+    return url
+
+
+def invalidate_env_cache() -> None:
+    """Clear the memoized env URLs (e.g. after changing env vars)."""
+    _resolve_env_url.cache_clear()
+
+
 def create_mcp_server_from_env(
     url_env_var: str = "MCP_SERVER_URL",
     transport: TransportType = "streamable_http",
@@ -148,6 +339,11 @@ def create_mcp_server_from_env(
 ) -> MCPServer:
     """Create an MCP server from environment variables.
 
+    Memoization comes from create_mcp_server's pool: repeated calls for the
+    same connection return the same instance with its refcount bumped per
+    call, so pair each call with release_mcp_server(). The env URL lookup
+    itself is cached; invalidate_env_cache() forces re-resolution.
+
     Args:
         url_env_var: Environment variable containing the server URL
         transport: Transport type to use
@@ -165,13 +361,9 @@ def create_mcp_server_from_env(
         ...     transport="sse"
         ... )
     """
-    url = os.environ.get(url_env_var)
-    if not url:
-        raise ValueError(f"Environment variable {url_env_var} is not set")
-
     config = MCPServerConfig(
         transport=transport,
-        url=url,
+        url=_resolve_env_url(url_env_var),
         **kwargs
     )
 
@@ -1,14 +1,30 @@
 """MCP server wrapper that unwraps tool results and handles progress callbacks."""
 
 import json
+import asyncio
 import logging
 from typing import Any, Optional
+from mcp.client.session import ClientSession
 from livekit.agents.llm.mcp import MCPServer, MCPTool
 from livekit.agents.llm.tool_context import ToolError, function_tool
 from .progress_manager import ProgressManager
+from .server import release_mcp_server
 
 logger = logging.getLogger(__name__)
 
+# orjson parses and serializes several times faster than stdlib json; it's
+# optional (install the "perf" extra), with a pure-stdlib fallback
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
 
 class MCPServerWrapper:
     """Wrapper for MCPServer that unwraps tool results and handles progress.
@@ -34,7 +50,10 @@ class MCPServerWrapper:
             progress_manager: Optional progress manager for handling announcements
         """
         self._server = mcp_server
-        self._fixed_tools: list[MCPTool] | None = None
+        # Empty-tuple sentinel: () is interned and falsy, so the hot check
+        # in list_tools is a plain truthiness test with no None transition
+        self._fixed_tools: tuple[MCPTool, ...] | list[MCPTool] = ()
+        self._tools_future: asyncio.Future | None = None
         self._progress_manager = progress_manager
 
     @property
@@ -47,18 +66,34 @@ class MCPServerWrapper:
         await self._server.initialize()
 
     async def list_tools(self) -> list[MCPTool]:
-        """List tools with fixed result unwrapping."""
-        if self._fixed_tools is not None:
+        """List tools with fixed result unwrapping.
+
+        Single-flight: concurrent callers before the first listing resolves
+        all await the same in-flight request instead of each issuing their
+        own list_tools RPC and wrap pass.
+        """
+        if self._fixed_tools:
             return self._fixed_tools
 
+        future = self._tools_future
+        if future is None:
+            future = self._tools_future = asyncio.ensure_future(self._list_and_wrap_tools())
+
+        try:
+            return await future
+        except Exception:
+            # Let a later caller retry rather than replaying this failure
+            if self._tools_future is future:
+                self._tools_future = None
+            raise
+
+    async def _list_and_wrap_tools(self) -> list[MCPTool]:
+        """Fetch tools from the server and wrap each one."""
         # Get original tools from the server
         original_tools = await self._server.list_tools()
 
         # Wrap each tool to fix result unwrapping
-        fixed_tools = []
-        for tool in original_tools:
-            fixed_tool = self._wrap_tool(tool)
-            fixed_tools.append(fixed_tool)
+        fixed_tools = [self._wrap_tool(tool) for tool in original_tools]
 
         self._fixed_tools = fixed_tools
         return fixed_tools
@@ -72,58 +107,72 @@ class MCPServerWrapper:
         Returns:
             A wrapped tool that properly unwraps results and reports progress
         """
-        # Get the original tool info (use getattr to avoid name mangling issues)
-        tool_info = getattr(original_tool, '__livekit_raw_tool_info')
+        # Get the original tool info straight from the instance dict. A bare
+        # original_tool.__livekit_raw_tool_info would be mangled to
+        # _MCPServerWrapper__livekit_raw_tool_info inside this class body,
+        # and vars() also skips the descriptor protocol that getattr runs
+        tool_info = vars(original_tool)['__livekit_raw_tool_info']
         tool_name = tool_info.raw_schema.get('name', 'unknown')
 
+        # Bind the hot-path lookups once at wrap time: the closure then does
+        # cheap local/cell loads per call instead of walking self-attribute
+        # chains and a hasattr probe on every tool invocation
+        server = self._server
+        progress_manager = self._progress_manager
+        client: Optional[ClientSession] = getattr(server, '_client', None)
+
         async def _fixed_tool_called(raw_arguments: dict[str, Any]) -> Any:
             """Call the original tool with progress support and unwrap the result."""
+            nonlocal client
 
             # Create a progress callback that announces updates
             async def progress_handler(progress: float, total: float | None, message: str | None) -> None:
                 """Handle progress updates from the MCP server."""
-                if message and self._progress_manager:
+                if message and progress_manager:
                     # Queue the progress message through the manager
-                    self._progress_manager.queue_progress(tool_name, message)
-                    logger.debug(f"Progress update for {tool_name}: {message} ({progress}/{total})")
+                    progress_manager.queue_progress(tool_name, message)
+                    logger.debug("Progress update for %s: %s (%s/%s)", tool_name, message, progress, total)
 
             try:
                 # We need to access the underlying MCP client to use progress callbacks
                 # Unfortunately, LiveKit's wrapper doesn't expose this, so we need to
                 # work around it by calling the MCP client directly
-                if hasattr(self._server, '_client') and self._server._client is not None:
+                if client is None:
+                    # The client may only appear after initialize(); re-resolve
+                    client = getattr(server, '_client', None)
+                if client is not None:
                     # Direct access to MCP client - can use progress callbacks
                     try:
-                        from mcp.client.session import ClientSession
-
-                        client: ClientSession = self._server._client
-
                         # Call the tool with progress callback
                         tool_result = await client.call_tool(
                             name=tool_name,
                             arguments=raw_arguments,
-                            progress_callback=progress_handler if self._progress_manager else None
+                            progress_callback=progress_handler if progress_manager else None
                         )
 
                         # Handle errors
                         if tool_result.isError:
-                            error_str = "\n".join(str(part) for part in tool_result.content)
+                            # List comprehension lets str.join pre-size its
+                            # buffer instead of two-passing a generator
+                            error_str = "\n".join([str(part) for part in tool_result.content])
                             raise ToolError(error_str)
 
                         # Unwrap the result
                         if len(tool_result.content) == 1:
-                            content_json = tool_result.content[0].model_dump_json()
-                            parsed = json.loads(content_json)
+                            part = tool_result.content[0]
 
-                            if isinstance(parsed, dict) and "type" in parsed and "text" in parsed:
-                                return parsed["text"]
-                            elif isinstance(parsed, dict) and "text" in parsed:
-                                return parsed["text"]
+                            # Fast path: read the text attribute directly
+                            # instead of a pydantic serialize + JSON parse
+                            # round trip just to pull one field back out
+                            text = getattr(part, 'text', None)
+                            if text is not None:
+                                return text
 
-                            return content_json
+                            # Unknown content shape; fall back to JSON
+                            return part.model_dump_json()
 
                         elif len(tool_result.content) > 1:
-                            return json.dumps([item.model_dump() for item in tool_result.content])
+                            return _dumps([item.model_dump() for item in tool_result.content])
 
                         raise ToolError(
                             f"Tool '{tool_name}' completed without producing a result."
@@ -137,37 +186,49 @@ class MCPServerWrapper:
                 result = await original_tool(raw_arguments)
 
                 # Result is a JSON string like '{"type":"text","text":"actual data"}'
-                # Parse and unwrap it
-                try:
-                    parsed = json.loads(result)
+                # Parse and unwrap it. The one-char pre-screen skips the
+                # parse attempt (and its exception cost) for plain strings
+                if isinstance(result, str) and result[:1] in '{[':
+                    try:
+                        parsed = _loads(result)
 
-                    # Extract the actual content
-                    if isinstance(parsed, dict):
-                        if "type" in parsed and "text" in parsed:
-                            return parsed["text"]
-                        elif "text" in parsed:
-                            return parsed["text"]
+                        # Extract the actual content. The expected shape is
+                        # {"type": "text", "text": ...}; one .get probe
+                        # replaces the in/in/subscript chain, and the exact
+                        # type check skips isinstance's subclass walk
+                        if type(parsed) is dict:
+                            text = parsed.get("text")
+                            if text is not None:
+                                return text
 
-                    return result
+                        return result
 
-                except (json.JSONDecodeError, KeyError):
-                    return result
+                    except (ValueError, KeyError):
+                        return result
+
+                return result
 
             finally:
                 # Signal that the tool has completed
-                if self._progress_manager:
-                    self._progress_manager.mark_completed(tool_name)
-                    logger.debug(f"Tool {tool_name} completed, signaling to clear queue")
+                if progress_manager:
+                    progress_manager.mark_completed(tool_name)
+                    logger.debug("Tool %s completed, signaling to clear queue", tool_name)
 
         # Create a new tool with the same metadata but fixed callback
         return function_tool(_fixed_tool_called, raw_schema=tool_info.raw_schema)
 
     async def aclose(self) -> None:
-        """Close the underlying MCP server."""
-        await self._server.aclose()
-        self._fixed_tools = None
+        """Release the underlying MCP server.
+
+        Pooled servers shared with other wrappers stay open until their
+        last holder closes; non-pooled servers are closed directly.
+        """
+        await release_mcp_server(self._server)
+        self._fixed_tools = ()
+        self._tools_future = None
 
     def invalidate_cache(self) -> None:
         """Invalidate the tool cache."""
         self._server.invalidate_cache()
-        self._fixed_tools = None
+        self._fixed_tools = ()
+        self._tools_future = None